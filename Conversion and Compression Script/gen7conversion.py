@@ -1,4 +1,5 @@
 import os
+import json
 import subprocess
 from pathlib import Path
 from datetime import datetime
@@ -13,12 +14,18 @@ OUTPUT_ROOT = r"./FFStall"
 NTFY_TOPIC = "mytopic"             # ntfy topic name
 NTFY_SERVER = "https://ntfy.sh"      # ntfy server URL (default public server)
 VIDEO_EXTENSIONS = {".mp4", ".mov", ".mkv", ".avi"}
+CONVERSION_CACHE_FILE = ".conversion_cache.json"  # Sidecar in the output folder
+DURATION_TOLERANCE = 1.0  # Seconds an output may differ from its source and still count as complete
 
 # =============================================================================
 # Global variable to store whether to use NVIDIA CUDA acceleration
 # =============================================================================
 USE_CUDA = False
 
+# FFmpeg argument template, built once in main() after USE_CUDA is known.
+# "{src}" and "{dst}" are filled in per file.
+FFMPEG_ARGS_TMPL = []
+
 # =============================================================================
 # Logging function: writes FFmpeg error output to a log file next to the output video.
 # =============================================================================
@@ -33,6 +40,33 @@ def log_ffmpeg_error(input_file: str, output_file: str, error_output: str) -> No
 # =============================================================================
 # FFmpeg conversion functions
 # =============================================================================
+def build_ffmpeg_args_template(use_cuda: bool) -> list:
+    # Build the FFmpeg command based on whether CUDA is available.
+    if use_cuda:
+        return [
+            "ffmpeg",
+            "-y",                        # Overwrite output file
+            "-hwaccel", "cuda",          # Use NVIDIA CUDA acceleration
+            "-i", "{src}",
+            "-vf", "scale=-2:720",       # Resize video to 720p height (width auto-adjusted)
+            "-c:v", "h264_nvenc",        # NVENC encoder for H.264
+            "-preset", "fast",
+            "-c:a", "aac",
+            "-b:a", "320k",
+            "{dst}",
+        ]
+    return [
+        "ffmpeg",
+        "-y",                        # Overwrite output file
+        "-i", "{src}",
+        "-vf", "scale=-2:720",       # Resize video to 720p height (width auto-adjusted)
+        "-c:v", "libx264",           # Use software-based H.264 encoding
+        "-preset", "fast",
+        "-c:a", "aac",
+        "-b:a", "320k",
+        "{dst}",
+    ]
+
 def get_video_duration(input_file: str) -> float:
     command = [
         "ffprobe",
@@ -56,32 +90,7 @@ def convert_video_file(input_file: str, output_file: str) -> None:
         print(f"Skipping file due to error reading duration: {input_file}")
         return
 
-    # Build the FFmpeg command based on whether CUDA is available.
-    if USE_CUDA:
-        command = [
-            "ffmpeg",
-            "-y",                        # Overwrite output file
-            "-hwaccel", "cuda",          # Use NVIDIA CUDA acceleration
-            "-i", input_file,
-            "-vf", "scale=-2:720",       # Resize video to 720p height (width auto-adjusted)
-            "-c:v", "h264_nvenc",        # NVENC encoder for H.264
-            "-preset", "fast",
-            "-c:a", "aac",
-            "-b:a", "320k",
-            output_file,
-        ]
-    else:
-        command = [
-            "ffmpeg",
-            "-y",                        # Overwrite output file
-            "-i", input_file,
-            "-vf", "scale=-2:720",       # Resize video to 720p height (width auto-adjusted)
-            "-c:v", "libx264",           # Use software-based H.264 encoding
-            "-preset", "fast",
-            "-c:a", "aac",
-            "-b:a", "320k",
-            output_file,
-        ]
+    command = [arg.format(src=input_file, dst=output_file) for arg in FFMPEG_ARGS_TMPL]
 
     # Start FFmpeg process and combine stdout and stderr so we can see all output.
     process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
@@ -102,6 +111,9 @@ def convert_video_file(input_file: str, output_file: str) -> None:
     except KeyboardInterrupt:
         print("\nConversion interrupted by user. Terminating FFmpeg process...")
         process.terminate()
+        process.wait()
+        # FFmpeg finalizes the file on SIGTERM; the truncated video would pass for a finished one
+        remove_partial_output(output_file)
         return
 
     # Capture any remaining output
@@ -114,28 +126,90 @@ def convert_video_file(input_file: str, output_file: str) -> None:
         print(f"  {input_file}")
         print("Logging FFmpeg error output...")
         log_ffmpeg_error(input_file, output_file, output)
+        remove_partial_output(output_file)
     else:
         print(f"\nFinished converting {input_file}")
 
+def remove_partial_output(output_file: str) -> None:
+    try:
+        os.remove(output_file)
+        print(f"Removed incomplete output: {output_file}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"Could not remove incomplete output {output_file}: {e}")
+
+# =============================================================================
+# Skip already-converted files
+# =============================================================================
+def load_conversion_cache(cache_file: Path) -> dict:
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_conversion_cache(cache_file: Path, cache: dict) -> None:
+    try:
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        print(f"Could not write conversion cache {cache_file}: {e}")
+
+def is_already_converted(input_file: Path, output_file: Path, cache: dict) -> bool:
+    """
+    True when output_file is newer than input_file and holds a video as long as
+    the source (within DURATION_TOLERANCE), so truncated outputs are converted
+    again. The ffprobe check is cached per source (mtime, size) so unchanged
+    files are only probed once.
+    """
+    if not output_file.exists():
+        return False
+    src_stat = input_file.stat()
+    out_mtime = output_file.stat().st_mtime
+    if out_mtime < src_stat.st_mtime:
+        return False
+
+    key = str(input_file)
+    entry = cache.get(key)
+    if (entry and entry["mtime"] == src_stat.st_mtime and entry["size"] == src_stat.st_size
+            and entry["output_mtime"] == out_mtime):
+        return True
+
+    out_duration = get_video_duration(str(output_file))
+    if out_duration <= 0 or abs(out_duration - get_video_duration(str(input_file))) > DURATION_TOLERANCE:
+        return False
+    cache[key] = {"mtime": src_stat.st_mtime, "size": src_stat.st_size, "output_mtime": out_mtime}
+    return True
+
 def process_folder(input_dir: str, output_dir: str, include_subdirs: bool = True) -> None:
     input_path = Path(input_dir)
     output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    cache_file = output_path / CONVERSION_CACHE_FILE
+    cache = load_conversion_cache(cache_file)
 
-    for root, dirs, files in os.walk(input_path):
-        current_path = Path(root)
-        if not include_subdirs and current_path != input_path:
-            continue
+    try:
+        for root, dirs, files in os.walk(input_path):
+            current_path = Path(root)
+            if not include_subdirs and current_path != input_path:
+                continue
 
-        rel_path = current_path.relative_to(input_path)
-        target_dir = output_path / rel_path
-        target_dir.mkdir(parents=True, exist_ok=True)
+            rel_path = current_path.relative_to(input_path)
+            target_dir = output_path / rel_path
+            target_dir.mkdir(parents=True, exist_ok=True)
 
-        for file in files:
-            file_path = current_path / file
-            if file_path.suffix.lower() in VIDEO_EXTENSIONS:
-                out_file = target_dir / f"{file_path.stem}_720p.mp4"
-                print(f"\nConverting:\n  Input: {file_path}\n  Output: {out_file}")
-                convert_video_file(str(file_path), str(out_file))
+            for file in files:
+                file_path = current_path / file
+                if file_path.suffix.lower() in VIDEO_EXTENSIONS:
+                    out_file = target_dir / f"{file_path.stem}_720p.mp4"
+                    if is_already_converted(file_path, out_file, cache):
+                        print(f"\nSkipping (already converted): {file_path}")
+                        continue
+                    print(f"\nConverting:\n  Input: {file_path}\n  Output: {out_file}")
+                    convert_video_file(str(file_path), str(out_file))
+    finally:
+        save_conversion_cache(cache_file, cache)
 
 # =============================================================================
 # ntfy Notification Function
@@ -166,7 +240,7 @@ def list_folders(root: str):
 # Main Interactive Function
 # =============================================================================
 def main() -> None:
-    global USE_CUDA
+    global USE_CUDA, FFMPEG_ARGS_TMPL
 
     # First, ask if this laptop supports NVIDIA CUDA acceleration.
     cuda_supported = questionary.confirm(
@@ -177,6 +251,7 @@ def main() -> None:
         print("Using NVIDIA GPU acceleration for FFmpeg.")
     else:
         print("Using CPU-based FFmpeg configuration (libx264).")
+    FFMPEG_ARGS_TMPL = build_ffmpeg_args_template(USE_CUDA)
 
     mode = questionary.select(
         "Select conversion mode:",
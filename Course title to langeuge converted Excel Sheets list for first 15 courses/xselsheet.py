@@ -1,7 +1,8 @@
 import os
 import re
 import requests
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from openpyxl import Workbook
 
 # ---------------------------
 # Configuration
@@ -113,6 +114,22 @@ def sort_videos(videos):
     parsed.sort(key=lambda x: (x[0], x[1]))
     return [title for (_, _, title) in parsed]
 
+def write_language_excel(folder_path, sorted_titles, lang):
+    """
+    Write a single language's Excel file using openpyxl's write-only mode,
+    streaming rows straight to disk.
+    """
+    folder_basename = os.path.basename(folder_path)
+    filename = f"{folder_basename}_{lang.lower()}.xlsx"
+    filepath = os.path.join(folder_path, filename)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append(["S.No", "Video Title", f"{lang} Translated Text"])
+    for idx, title in enumerate(sorted_titles, start=1):
+        ws.append([idx, title, ""])
+    wb.save(filepath)
+    return filepath
+
 def create_excel_files(folder_path, sorted_titles, languages):
     """
     For each language, create an Excel file with three columns:
@@ -122,18 +139,15 @@ def create_excel_files(folder_path, sorted_titles, languages):
     
     The Excel file is saved in the folder_path with a name like:
     "<folder_name>_<language>.xlsx"
+    The per-language files are independent, so they are written in parallel.
     """
-    for lang in languages:
-        df = pd.DataFrame({
-            "S.No": list(range(1, len(sorted_titles) + 1)),
-            "Video Title": sorted_titles,
-            f"{lang} Translated Text": ["" for _ in sorted_titles]
-        })
-        folder_basename = os.path.basename(folder_path)
-        filename = f"{folder_basename}_{lang.lower()}.xlsx"
-        filepath = os.path.join(folder_path, filename)
-        df.to_excel(filepath, index=False)
-        print(f"Created file: {filepath}")
+    with ThreadPoolExecutor(max_workers=min(len(languages), 4) or 1) as executor:
+        filepaths = executor.map(
+            lambda lang: write_language_excel(folder_path, sorted_titles, lang),
+            languages
+        )
+        for filepath in filepaths:
+            print(f"Created file: {filepath}")
 
 # ---------------------------
 # Main processing function
@@ -5,6 +5,7 @@ from PyQt5 import QtWidgets, QtCore
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from google.oauth2.credentials import Credentials
+from google.auth.transport.requests import Request
 
 # The scope required for full YouTube management.
 SCOPES = ["https://www.googleapis.com/auth/youtube.force-ssl"]
@@ -79,29 +80,46 @@ class YouTubeManager(QtWidgets.QWidget):
                 creds = Credentials.from_authorized_user_file(token_file, SCOPES)
             except Exception as e:
                 print("Error loading token.json:", e)
-        # If credentials are missing or invalid, run the OAuth flow.
+        # If credentials are missing or invalid, refresh them or run the OAuth flow.
         if not creds or not creds.valid:
-            flow = InstalledAppFlow.from_client_secrets_file(self.client_secret_file, SCOPES)
-            creds = flow.run_local_server(port=8080)
+            if creds and creds.expired and creds.refresh_token:
+                try:
+                    creds.refresh(Request())
+                except Exception as e:
+                    print("Error refreshing token:", e)
+                    creds = None
+            if not creds or not creds.valid:
+                flow = InstalledAppFlow.from_client_secrets_file(self.client_secret_file, SCOPES)
+                creds = flow.run_local_server(port=8080)
             with open(token_file, "w") as token:
                 token.write(creds.to_json())
-        self.youtube = build('youtube', 'v3', credentials=creds)
+        # Use the discovery document bundled with googleapiclient instead of fetching it.
+        self.youtube = build('youtube', 'v3', credentials=creds, static_discovery=True, cache_discovery=False)
         self.load_playlists()
 
     def load_playlists(self):
-        # Fetch playlists along with 'snippet' and 'contentDetails' (for video count).
+        # Fetch playlists along with 'snippet' and 'contentDetails' (for video count),
+        # adding each page to the table as soon as it arrives.
+        self.playlists = []
+        self.table.setRowCount(0)
         request = self.youtube.playlists().list(
             part="snippet,contentDetails",
             mine=True,
-            maxResults=50  # For channels with >50 playlists, add pagination logic.
+            maxResults=50
         )
-        response = request.execute()
-        self.playlists = response.get("items", [])
-        self.populate_table()
+        while request is not None:
+            response = request.execute()
+            items = response.get("items", [])
+            self.playlists.extend(items)
+            self._append_playlist_rows(items)
+            QtWidgets.QApplication.processEvents()  # Keep the UI responsive between pages.
+            request = self.youtube.playlists().list_next(request, response)
+        # Enable the delete button now that playlists are loaded.
+        self.deleteButton.setEnabled(True)
+        self.update_status()
 
-    def populate_table(self):
-        self.table.setRowCount(len(self.playlists))
-        for row, playlist in enumerate(self.playlists):
+    def _append_playlist_rows(self, playlists):
+        for playlist in playlists:
             title = playlist["snippet"].get("title", "No Title")
             description = playlist["snippet"].get("description", "")
             # Retrieve the number of videos in the playlist.
@@ -116,12 +134,11 @@ class YouTubeManager(QtWidgets.QWidget):
             checkbox.video_count = video_count
             checkbox.stateChanged.connect(self.update_status)
 
+            row = self.table.rowCount()
+            self.table.insertRow(row)
             self.table.setItem(row, 0, title_item)
             self.table.setItem(row, 1, desc_item)
             self.table.setCellWidget(row, 2, checkbox)
-        # Enable the delete button now that playlists are loaded.
-        self.deleteButton.setEnabled(True)
-        self.update_status()
 
     def update_status(self):
         selected_playlists = 0
@@ -1,29 +1,47 @@
 import os
-import io
+import json
+import queue
+import logging
+import subprocess
 import google.auth
 import datetime
-from google.auth.transport.requests import Request
+from google.auth.transport.requests import AuthorizedSession, Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
-from moviepy import VideoFileClip
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # Google Drive API Scope
 SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
 
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 LOG_FILE = "video_duration_log.txt"
 
+logger = logging.getLogger("video_duration")
+
+def start_log_listener():
+    """Routes log records through a queue to one writer thread for the log file and console."""
+    formatter = logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+    file_handler = RotatingFileHandler(LOG_FILE, maxBytes=10 << 20, backupCount=5, encoding="utf-8")
+    console_handler = logging.StreamHandler()
+    for handler in (file_handler, console_handler):
+        handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, console_handler)
+    listener.start()
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return listener
+
 def log_message(message):
     """Writes logs to a file and prints to console."""
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_entry = f"[{timestamp}] {message}"
-    print(log_entry)
-    with open(LOG_FILE, "a", encoding="utf-8") as log_file:
-        log_file.write(log_entry + "\n")
+    logger.info(message)
 
 def authenticate_google_drive():
-    """Authenticates and returns Google Drive API service."""
+    """Authenticates and returns the Google Drive API service and an authorized HTTP session."""
     creds = None
     if os.path.exists('token.json'):
         creds = Credentials.from_authorized_user_file('token.json', SCOPES)
@@ -38,7 +56,9 @@ def authenticate_google_drive():
         with open('token.json', 'w') as token:
             token.write(creds.to_json())
 
-    return build('drive', 'v3', credentials=creds)
+    # Use the discovery document bundled with googleapiclient instead of fetching it
+    service = build('drive', 'v3', credentials=creds, static_discovery=True, cache_discovery=False)
+    return service, AuthorizedSession(creds)
 
 def list_files_in_folder(service, folder_id, shared_drive_id):
     """Lists all files and folders inside a given folder."""
@@ -53,32 +73,42 @@ def list_files_in_folder(service, folder_id, shared_drive_id):
 
     return results.get('files', [])
 
-def get_video_duration(service, file_id, filename):
-    """Downloads the video file temporarily and gets its duration."""
-    request = service.files().get_media(fileId=file_id)
-    fh = io.BytesIO()
-    downloader = MediaIoBaseDownload(fh, request)
-    done = False
-    while not done:
-        status, done = downloader.next_chunk()
-    
-    fh.seek(0)
-    temp_filename = f'temp_video.{filename.split(".")[-1]}'
-    with open(temp_filename, 'wb') as f:
-        f.write(fh.read())
-
-    clip = VideoFileClip(temp_filename)
-    duration = clip.duration
-    clip.close()
-    
-    os.remove(temp_filename)
-    return duration
+def get_video_duration(session, file_id, filename):
+    """Streams the video file from Drive straight into ffprobe and gets its duration."""
+    url = f"https://www.googleapis.com/drive/v3/files/{file_id}"
+    process = subprocess.Popen(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "json", "-i", "pipe:0"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    try:
+        with session.get(url, params={"alt": "media", "supportsAllDrives": "true"}, stream=True) as response:
+            response.raise_for_status()
+            try:
+                for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    process.stdin.write(chunk)
+            except BrokenPipeError:
+                pass  # ffprobe exited once it found the duration, stop downloading
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        output = process.stdout.read()
+        error_output = process.stderr.read()
+        process.wait()
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+    if process.returncode != 0:
+        raise RuntimeError(f"ffprobe failed for {filename}: {error_output.decode(errors='replace').strip()}")
+    return float(json.loads(output)["format"]["duration"])
 
 def format_time(seconds):
     """Converts seconds to hh:mm:ss format."""
     return str(datetime.timedelta(seconds=int(seconds)))
 
-def traverse_folder(service, folder_id, shared_drive_id, folder_name):
+def traverse_folder(service, session, folder_id, shared_drive_id, folder_name):
     """Recursively traverses a folder, processes video files, and returns total duration."""
     total_duration = 0
     files = list_files_in_folder(service, folder_id, shared_drive_id)
@@ -87,10 +117,10 @@ def traverse_folder(service, folder_id, shared_drive_id, folder_name):
 
     for file in files:
         if file['mimeType'] == 'application/vnd.google-apps.folder':  # If it's a folder, recurse
-            total_duration += traverse_folder(service, file['id'], shared_drive_id, file['name'])
+            total_duration += traverse_folder(service, session, file['id'], shared_drive_id, file['name'])
         elif file['mimeType'] in ['video/mp4', 'video/quicktime']:  # Process only .mp4 and .mov files
             log_message(f"🎬 Processing video: {file['name']}...")
-            duration = get_video_duration(service, file['id'], file['name'])
+            duration = get_video_duration(session, file['id'], file['name'])
             log_message(f"✅ Duration: {format_time(duration)} hours of video")
             total_duration += duration
     
@@ -98,10 +128,17 @@ def traverse_folder(service, folder_id, shared_drive_id, folder_name):
     return total_duration
 
 def main():
+    listener = start_log_listener()
+    try:
+        scan_shared_drive()
+    finally:
+        listener.stop()
+
+def scan_shared_drive():
     start_time = datetime.datetime.now()
     log_message(f"\n🚀 The log is starting at {start_time.strftime('%H:%M:%S')} on {start_time.strftime('%Y-%m-%d')}")
 
-    service = authenticate_google_drive()
+    service, session = authenticate_google_drive()
 
     # Replace with your actual Shared Drive ID
     shared_drive_id = '0AHxy0uU6Xa9yUk9PVA'  
@@ -110,7 +147,7 @@ def main():
     root_folder_id = '18nRASqAiHLPxevUux6dQbwwbIwyM1pBW'  
 
     log_message(f"\n🔍 Scanning Shared Drive (ID: {shared_drive_id}) for .mp4 and .mov videos...")
-    total_duration = traverse_folder(service, root_folder_id, shared_drive_id, "Root Folder")
+    total_duration = traverse_folder(service, session, root_folder_id, shared_drive_id, "Root Folder")
 
     end_time = datetime.datetime.now()
     log_message(f"\n🎥 Total video content in Shared Drive: {format_time(total_duration)}")
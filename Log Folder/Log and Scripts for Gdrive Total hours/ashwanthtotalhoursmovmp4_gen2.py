@@ -1,23 +1,41 @@
 import os
-import io
-import google.auth
+import json
+import asyncio
+import contextlib
+import subprocess
+import tempfile
+import aiohttp
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
-from moviepy import VideoFileClip
 import datetime
 
+try:
+    import orjson  # Parses the Drive list responses faster than the stdlib json
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop  # libuv-backed event loop, much cheaper per request on Linux
+except ImportError:
+    uvloop = None
+
 # Google Drive API Scope
 SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
 
+DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
+MAX_CONCURRENT_REQUESTS = 64  # In-flight Drive API calls
+MAX_CONCURRENT_DOWNLOADS = 4  # Videos downloaded at the same time
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Access tokens last an hour and a full scan can take longer; refresh this long before expiry
+TOKEN_REFRESH_MARGIN = datetime.timedelta(minutes=5)
+
 def authenticate_google_drive():
-    """Authenticates and returns Google Drive API service."""
+    """Authenticates and returns valid Google Drive credentials."""
     creds = None
     if os.path.exists('token.json'):
         creds = Credentials.from_authorized_user_file('token.json', SCOPES)
-    
+
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
             creds.refresh(Request())
@@ -28,76 +46,141 @@ def authenticate_google_drive():
         with open('token.json', 'w') as token:
             token.write(creds.to_json())
 
-    return build('drive', 'v3', credentials=creds)
-
-def list_files_in_folder(service, folder_id, shared_drive_id):
-    """Lists all files and folders inside a given folder."""
-    results = service.files().list(
-        q=f"'{folder_id}' in parents",
-        fields="nextPageToken, files(id, name, mimeType)",
-        corpora="drive",
-        driveId=shared_drive_id,
-        includeItemsFromAllDrives=True,
-        supportsAllDrives=True
-    ).execute()
-
-    return results.get('files', [])
-
-def get_video_duration(service, file_id, filename):
-    """Downloads the video file temporarily and gets its duration."""
-    request = service.files().get_media(fileId=file_id)
-    fh = io.BytesIO()
-    downloader = MediaIoBaseDownload(fh, request)
-    done = False
-    while not done:
-        status, done = downloader.next_chunk()
-    
-    fh.seek(0)
-    temp_filename = f'temp_video.{filename.split(".")[-1]}'
-    with open(temp_filename, 'wb') as f:
-        f.write(fh.read())
-
-    clip = VideoFileClip(temp_filename)
-    duration = clip.duration
-    clip.close()
-    
-    os.remove(temp_filename)
-    return duration
+    return creds
+
+class DriveToken:
+    """Hands out the bearer token for the aiohttp requests, refreshing it when it is about to expire."""
+    def __init__(self, creds):
+        self.creds = creds
+        self._refresh_lock = asyncio.Lock()
+
+    def _needs_refresh(self, stale_token):
+        creds = self.creds
+        if not creds.valid or creds.token == stale_token:
+            return True
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)  # expiry is naive UTC
+        return creds.expiry is not None and creds.expiry - now < TOKEN_REFRESH_MARGIN
+
+    async def get(self, stale_token=None):
+        """Returns a current token; stale_token is one the API just rejected, it is never returned again."""
+        if self._needs_refresh(stale_token):
+            async with self._refresh_lock:
+                # Concurrent callers wait here; only the first one actually refreshes
+                if self._needs_refresh(stale_token):
+                    await asyncio.to_thread(self.creds.refresh, Request())
+        return self.creds.token
+
+@contextlib.asynccontextmanager
+async def drive_get(session, drive_token, url, params):
+    """GETs a Drive API URL with a current token; a 401 is retried once with a refreshed token."""
+    token = await drive_token.get()
+    for attempt in range(2):
+        async with session.get(url, params=params, headers={"Authorization": f"Bearer {token}"}) as resp:
+            if resp.status == 401 and attempt == 0:
+                token = await drive_token.get(stale_token=token)
+                continue
+            yield resp
+            return
+
+async def list_files_in_folder(session, drive_token, api_semaphore, folder_id, shared_drive_id):
+    """Lists all files and folders inside a given folder, following every result page."""
+    files = []
+    params = {
+        "q": f"'{folder_id}' in parents",
+        "fields": "nextPageToken, files(id, name, mimeType)",
+        "corpora": "drive",
+        "driveId": shared_drive_id,
+        "includeItemsFromAllDrives": "true",
+        "supportsAllDrives": "true",
+    }
+    while True:
+        async with api_semaphore:
+            async with drive_get(session, drive_token, DRIVE_FILES_URL, params) as resp:
+                resp.raise_for_status()
+                results = orjson.loads(await resp.read()) if orjson else await resp.json()
+        files.extend(results.get('files', []))
+        page_token = results.get('nextPageToken')
+        if not page_token:
+            return files
+        params["pageToken"] = page_token
+
+def _ffprobe_duration(path):
+    """Returns a video's duration in seconds as reported by ffprobe."""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "json", path],
+        capture_output=True, check=True
+    )
+    return float(json.loads(result.stdout)["format"]["duration"])
+
+async def get_video_duration(session, drive_token, download_semaphore, file_id, filename):
+    """Streams the video file to a temporary file and gets its duration."""
+    # Every video of the tree waits here at once; only the download slots get a temp file and an open fd
+    async with download_semaphore:
+        fd, temp_filename = tempfile.mkstemp(suffix=f'.{filename.split(".")[-1]}')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                async with drive_get(session, drive_token, f"{DRIVE_FILES_URL}/{file_id}",
+                                     {"alt": "media", "supportsAllDrives": "true"}) as resp:
+                    resp.raise_for_status()
+                    async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+            # ffprobe is blocking, keep it off the event loop
+            return await asyncio.to_thread(_ffprobe_duration, temp_filename)
+        finally:
+            os.remove(temp_filename)
 
 def format_time(seconds):
     """Converts seconds to hh:mm:ss format."""
     return str(datetime.timedelta(seconds=int(seconds)))
 
-def traverse_folder(service, folder_id, shared_drive_id, folder_name):
-    """Recursively traverses a folder, processes video files, and returns total duration."""
-    total_duration = 0
-    files = list_files_in_folder(service, folder_id, shared_drive_id)
+async def process_video(session, drive_token, download_semaphore, file):
+    """Gets the duration of a single video and reports it."""
+    duration = await get_video_duration(session, drive_token, download_semaphore, file['id'], file['name'])
+    print(f"🎬 Processed video: {file['name']} ✅ Duration: {format_time(duration)}")
+    return duration
+
+async def traverse_folder(session, drive_token, api_semaphore, download_semaphore, folder_id, shared_drive_id, folder_name):
+    """Traverses a folder concurrently, processes video files, and returns total duration."""
+    files = await list_files_in_folder(session, drive_token, api_semaphore, folder_id, shared_drive_id)
 
     print(f"\n📁 Entering folder: {folder_name}")
 
+    tasks = []
     for file in files:
         if file['mimeType'] == 'application/vnd.google-apps.folder':  # If it's a folder, recurse
-            total_duration += traverse_folder(service, file['id'], shared_drive_id, file['name'])
+            tasks.append(traverse_folder(session, drive_token, api_semaphore, download_semaphore,
+                                         file['id'], shared_drive_id, file['name']))
         elif file['mimeType'] in ['video/mp4', 'video/quicktime']:  # Process only .mp4 and .mov files
-            print(f"🎬 Processing video: {file['name']}...", end=" ")
-            duration = get_video_duration(service, file['id'], file['name'])
-            print(f"✅ Duration: {format_time(duration)}")
-            total_duration += duration
-    
+            tasks.append(process_video(session, drive_token, download_semaphore, file))
+
+    total_duration = sum(await asyncio.gather(*tasks))
     print(f"📊 Folder '{folder_name}' has {format_time(total_duration)} of video content.")
     return total_duration
 
+async def scan_drive(creds, root_folder_id, shared_drive_id):
+    """Opens an HTTP session and scans the Shared Drive folder tree; every request gets a current token."""
+    api_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    download_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+    drive_token = DriveToken(creds)
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        return await traverse_folder(session, drive_token, api_semaphore, download_semaphore,
+                                     root_folder_id, shared_drive_id, "Root Folder")
+
 def main():
-    service = authenticate_google_drive()
+    creds = authenticate_google_drive()
 
     # Replace with your actual Shared Drive ID
-    shared_drive_id = '0AHxy0uU6Xa9yUk9PVA'  
+    shared_drive_id = '0AHxy0uU6Xa9yUk9PVA'
 
     # Replace with the root folder inside the Shared Drive
-    root_folder_id = '1-39S98B4nB_AB12w7MxJSFGBbKp-luCS' 
+    root_folder_id = '1-39S98B4nB_AB12w7MxJSFGBbKp-luCS'
+
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     print(f"\n🔍 Scanning Shared Drive (ID: {shared_drive_id}) for .mp4 and .mov videos...")
-    total_duration = traverse_folder(service, root_folder_id, shared_drive_id, "Root Folder")
+    total_duration = asyncio.run(scan_drive(creds, root_folder_id, shared_drive_id))
     print(f"\n🎥 Total video content in Shared Drive: {format_time(total_duration)}\n")
 
 if __name__ == '__main__':
@@ -1,18 +1,19 @@
 import os
-import io
+import json
+import subprocess
 import google.auth
-from google.auth.transport.requests import Request
+from google.auth.transport.requests import AuthorizedSession, Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
-from moviepy import VideoFileClip
 
 # Google Drive API Scope
 SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
 
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 def authenticate_google_drive():
-    """Authenticates and returns Google Drive API service."""
+    """Authenticates and returns the Google Drive API service and an authorized HTTP session."""
     creds = None
     if os.path.exists('token.json'):
         creds = Credentials.from_authorized_user_file('token.json', SCOPES)
@@ -27,7 +28,9 @@ def authenticate_google_drive():
         with open('token.json', 'w') as token:
             token.write(creds.to_json())
 
-    return build('drive', 'v3', credentials=creds)
+    # Use the discovery document bundled with googleapiclient instead of fetching it
+    service = build('drive', 'v3', credentials=creds, static_discovery=True, cache_discovery=False)
+    return service, AuthorizedSession(creds)
 
 def list_files_in_folder(service, folder_id, shared_drive_id):
     """Lists all files and folders inside a given folder."""
@@ -42,28 +45,38 @@ def list_files_in_folder(service, folder_id, shared_drive_id):
 
     return results.get('files', [])
 
-def get_video_duration(service, file_id, filename):
-    """Downloads the video file temporarily and gets its duration."""
-    request = service.files().get_media(fileId=file_id)
-    fh = io.BytesIO()
-    downloader = MediaIoBaseDownload(fh, request)
-    done = False
-    while not done:
-        status, done = downloader.next_chunk()
-    
-    fh.seek(0)
-    temp_filename = f'temp_video.{filename.split(".")[-1]}'
-    with open(temp_filename, 'wb') as f:
-        f.write(fh.read())
+def get_video_duration(session, file_id, filename):
+    """Streams the video file from Drive straight into ffprobe and gets its duration."""
+    url = f"https://www.googleapis.com/drive/v3/files/{file_id}"
+    process = subprocess.Popen(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "json", "-i", "pipe:0"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    try:
+        with session.get(url, params={"alt": "media", "supportsAllDrives": "true"}, stream=True) as response:
+            response.raise_for_status()
+            try:
+                for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    process.stdin.write(chunk)
+            except BrokenPipeError:
+                pass  # ffprobe exited once it found the duration, stop downloading
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        output = process.stdout.read()
+        error_output = process.stderr.read()
+        process.wait()
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
 
-    clip = VideoFileClip(temp_filename)
-    duration = clip.duration
-    clip.close()
-    
-    os.remove(temp_filename)
-    return duration
+    if process.returncode != 0:
+        raise RuntimeError(f"ffprobe failed for {filename}: {error_output.decode(errors='replace').strip()}")
+    return float(json.loads(output)["format"]["duration"])
 
-def traverse_folder(service, folder_id, shared_drive_id):
+def traverse_folder(service, session, folder_id, shared_drive_id):
     """Recursively traverses a folder, processes video files, and returns total duration."""
     total_duration = 0
     files = list_files_in_folder(service, folder_id, shared_drive_id)
@@ -71,17 +84,17 @@ def traverse_folder(service, folder_id, shared_drive_id):
     for file in files:
         if file['mimeType'] == 'application/vnd.google-apps.folder':  # If it's a folder, recurse
             print(f"📁 Entering folder: {file['name']}")
-            total_duration += traverse_folder(service, file['id'], shared_drive_id)
+            total_duration += traverse_folder(service, session, file['id'], shared_drive_id)
         elif file['mimeType'] in ['video/mp4', 'video/quicktime']:  # Process only .mp4 and .mov files
             print(f"🎬 Processing video: {file['name']}")
-            duration = get_video_duration(service, file['id'], file['name'])
+            duration = get_video_duration(session, file['id'], file['name'])
             print(f"✅ File: {file['name']}, Duration: {duration:.2f} seconds")
             total_duration += duration
     
     return total_duration
 
 def main():
-    service = authenticate_google_drive()
+    service, session = authenticate_google_drive()
 
     # Replace with your actual Shared Drive ID
     shared_drive_id = '0AHxy0uU6Xa9yUk9PVA'  
@@ -90,7 +103,7 @@ def main():
     root_folder_id = '1-39S98B4nB_AB12w7MxJSFGBbKp-luCS'  
 
     print(f"🔍 Scanning Shared Drive (ID: {shared_drive_id}) for .mp4 and .mov videos...")
-    total_duration = traverse_folder(service, root_folder_id, shared_drive_id)
+    total_duration = traverse_folder(service, session, root_folder_id, shared_drive_id)
     print(f"🎥 Total duration of all videos: {total_duration:.2f} seconds")
 
 if __name__ == '__main__':
@@ -1,17 +1,21 @@
 import os
 import io
+import subprocess
 import google.auth
 import datetime
+from collections import defaultdict, deque
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
-from moviepy import VideoFileClip
 
 # Google Drive API Scope
 SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
 
+# Number of folders whose children are fetched with a single files().list call
+BATCH_SIZE = 50
+
 def format_time_hms(seconds):
     """Converts seconds to 'X hours Y minutes Z seconds' format."""
     hours = seconds // 3600
@@ -51,18 +55,26 @@ def authenticate_google_drive():
 
     return build('drive', 'v3', credentials=creds)
 
-def list_files_in_folder(service, folder_id, shared_drive_id):
-    """Lists all files and folders inside a given folder."""
-    results = service.files().list(
-        q=f"'{folder_id}' in parents",
-        fields="nextPageToken, files(id, name, mimeType, name)",
-        corpora="drive",
-        driveId=shared_drive_id,
-        includeItemsFromAllDrives=True,
-        supportsAllDrives=True
-    ).execute()
-
-    return results.get('files', [])
+def list_files_in_folders(service, folder_ids, shared_drive_id):
+    """Lists all files and folders inside any of the given folders, following every result page."""
+    parents_query = " or ".join(f"'{folder_id}' in parents" for folder_id in folder_ids)
+    files = []
+    page_token = None
+    while True:
+        results = service.files().list(
+            q=parents_query,
+            fields="nextPageToken, files(id, name, mimeType, parents, videoMediaMetadata/durationMillis)",
+            corpora="drive",
+            driveId=shared_drive_id,
+            includeItemsFromAllDrives=True,
+            supportsAllDrives=True,
+            pageSize=1000,
+            pageToken=page_token
+        ).execute()
+        files.extend(results.get('files', []))
+        page_token = results.get('nextPageToken')
+        if not page_token:
+            return files
 
 def get_video_duration(service, file_id, filename):
     """Downloads the video file temporarily and gets its duration."""
@@ -78,31 +90,58 @@ def get_video_duration(service, file_id, filename):
     with open(temp_filename, 'wb') as f:
         f.write(fh.read())
 
-    clip = VideoFileClip(temp_filename)
-    duration = clip.duration
-    clip.close()
+    # ffprobe only reads the container header, no decoders are set up
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=nw=1:nk=1', temp_filename],
+        capture_output=True, check=True
+    )
+    duration = float(result.stdout)
     
     os.remove(temp_filename)
     return duration
 
-def traverse_folder(service, folder_id, shared_drive_id, folder_name, log_file):
-    """Recursively traverses a folder, processes video files, and returns total duration."""
-    total_duration = 0
-    files = list_files_in_folder(service, folder_id, shared_drive_id)
-
-    log_message(log_file, f"\n📁 Entering folder: {folder_name}")
-
-    for file in files:
-        if file['mimeType'] == 'application/vnd.google-apps.folder':  # If it's a folder, recurse
-            total_duration += traverse_folder(service, file['id'], shared_drive_id, file['name'], log_file)
-        elif file['mimeType'] in ['video/mp4', 'video/quicktime']:  # Process only .mp4 and .mov files
-            log_message(log_file, f"🎬 Processing video: {file['name']}...")
-            duration = get_video_duration(service, file['id'], file['name'])
-            log_message(log_file, f"✅ Duration: {format_time_hms(duration)}")
-            total_duration += duration
-    
-    log_message(log_file, f"📊 Folder '{folder_name}' has {format_time_hms(total_duration)} of video content.")
-    return total_duration
+def traverse_folder(service, root_folder_id, shared_drive_id, root_folder_name, log_file):
+    """
+    Walks the folder tree breadth-first, listing the children of up to BATCH_SIZE
+    folders per API call, processes video files, and returns total duration.
+    """
+    folder_names = {root_folder_id: root_folder_name}
+    folder_parents = {}  # sub-folder id -> parent folder id
+    folder_order = [root_folder_id]  # Discovery order, parents always before children
+    folder_totals = defaultdict(float)  # Duration of the videos directly inside each folder
+    pending = deque([root_folder_id])
+
+    while pending:
+        batch = [pending.popleft() for _ in range(min(BATCH_SIZE, len(pending)))]
+        batch_ids = set(batch)
+        for folder_id in batch:
+            log_message(log_file, f"\n📁 Entering folder: {folder_names[folder_id]}")
+
+        for file in list_files_in_folders(service, batch, shared_drive_id):
+            parent_id = next(p for p in file.get('parents', []) if p in batch_ids)
+            if file['mimeType'] == 'application/vnd.google-apps.folder':  # Queue sub-folders for a later batch
+                folder_names[file['id']] = file['name']
+                folder_parents[file['id']] = parent_id
+                folder_order.append(file['id'])
+                pending.append(file['id'])
+            elif file['mimeType'] in ['video/mp4', 'video/quicktime']:  # Process only .mp4 and .mov files
+                log_message(log_file, f"🎬 Processing video: {file['name']}...")
+                duration_millis = file.get('videoMediaMetadata', {}).get('durationMillis')
+                if duration_millis is not None:
+                    duration = int(duration_millis) / 1000  # Drive already knows it, skip the download
+                else:
+                    duration = get_video_duration(service, file['id'], file['name'])
+                log_message(log_file, f"✅ Duration: {format_time_hms(duration)}")
+                folder_totals[parent_id] += duration
+
+    # Roll totals up from the deepest folders so each folder reports its whole subtree
+    for folder_id in reversed(folder_order):
+        total_duration = folder_totals[folder_id]
+        log_message(log_file, f"📊 Folder '{folder_names[folder_id]}' has {format_time_hms(total_duration)} of video content.")
+        if folder_id in folder_parents:
+            folder_totals[folder_parents[folder_id]] += total_duration
+
+    return folder_totals[root_folder_id]
 
 def main():
     service = authenticate_google_drive()
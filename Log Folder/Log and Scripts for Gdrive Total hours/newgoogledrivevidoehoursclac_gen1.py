@@ -1,17 +1,67 @@
 import os
-import io
+import json
+import time
+import queue
+import random
+import logging
+import sqlite3
+import asyncio
+import contextlib
+import subprocess
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+import aiohttp
+import numpy as np
+import requests
 import google.auth
 import datetime
-from google.auth.transport.requests import Request
+from google.auth.transport.requests import AuthorizedSession, Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
-from moviepy import VideoFileClip
+from googleapiclient.errors import HttpError
+
+try:
+    import orjson  # Parses the Drive list responses faster than the stdlib json
+except ImportError:
+    orjson = None
 
 # Google Drive API Scope
 SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
 
+# Number of folders whose children are fetched with a single files().list call
+BATCH_SIZE = 50
+# Concurrent files list requests, kept low to stay inside Drive's rate limits
+MAX_CONCURRENT_REQUESTS = 8
+
+# Rate-limit and transient server errors are retried with exponential backoff and jitter
+RETRYABLE_STATUSES = (429, 500, 502, 503)
+MAX_ATTEMPTS = 6
+MAX_BACKOFF_SECONDS = 60
+
+DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
+# Google allows at most 100 calls in one batch request
+MAX_BATCH_REQUESTS = 100
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Access tokens last an hour and a full scan can take longer; refresh this long before expiry
+TOKEN_REFRESH_MARGIN = datetime.timedelta(minutes=5)
+
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+SHORTCUT_MIME_TYPE = 'application/vnd.google-apps.shortcut'
+VIDEO_MIME_TYPES = ('video/mp4', 'video/quicktime')
+# Only folders, videos and shortcuts (which may point at videos) are returned by the listing
+LISTED_MIME_TYPES_QUERY = " or ".join(
+    f"mimeType='{mime_type}'" for mime_type in (FOLDER_MIME_TYPE, SHORTCUT_MIME_TYPE) + VIDEO_MIME_TYPES
+)
+
+# Durations of downloaded videos, reused while the file's modifiedTime is unchanged
+DURATION_CACHE_DB = "durations.sqlite"
+CACHE_COMMIT_EVERY = 50
+
+logger = logging.getLogger("gdrive_scan")
+# Verbose per-video metadata goes to its own file only
+detail_logger = logging.getLogger("gdrive_scan.detail")
+
 def format_time_hms(seconds):
     """Converts seconds to 'X hours Y minutes Z seconds' format."""
     hours = int(seconds // 3600)
@@ -26,20 +76,65 @@ def get_log_filenames(shared_drive_id, root_folder_name):
     base_filename = f"{timestamp}_{shared_drive_id}_{safe_root_folder_name}"
     return f"duration_log_{base_filename}.txt", f"detailed_log_{base_filename}.txt"
 
-def log_message(log_file, message, detailed_log_file=None, detailed_message=None):
-    """Writes logs to a file and prints to console. Optionally writes debug details separately."""
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_entry = f"[{timestamp}] {message}"
-    print(log_entry)
-    with open(log_file, "a", encoding="utf-8") as log:
-        log.write(log_entry + "\n")
-    
-    if detailed_log_file and detailed_message:
-        with open(detailed_log_file, "a", encoding="utf-8") as detailed_log:
-            detailed_log.write(f"[{timestamp}] {detailed_message}\n")
+def setup_logging(log_path, detailed_log_path):
+    """
+    Routes both loggers through one queue to a single writer thread, so the event
+    loop and worker threads only enqueue records. Per-folder progress is logged
+    at DEBUG, so it is skipped without being formatted at the default INFO level.
+    Returns the started listener, which must be stopped to flush the logs.
+    """
+    formatter = logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+    is_detail = logging.Filter(detail_logger.name)
+
+    file_handler = logging.FileHandler(log_path, encoding="utf-8")
+    console_handler = logging.StreamHandler()
+    for handler in (file_handler, console_handler):
+        handler.addFilter(lambda record: not is_detail.filter(record))
+    detailed_handler = logging.FileHandler(detailed_log_path, encoding="utf-8")
+    detailed_handler.addFilter(is_detail)
+    for handler in (file_handler, console_handler, detailed_handler):
+        handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, console_handler, detailed_handler)
+    listener.start()
+    queue_handler = QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    detail_logger.addHandler(queue_handler)
+    detail_logger.setLevel(logging.DEBUG)
+    detail_logger.propagate = False
+    return listener
+
+def backoff_delay(attempt, retry_after=None):
+    """Returns how long to wait before the next attempt, preferring the server's Retry-After."""
+    if retry_after is not None:
+        try:
+            return min(float(retry_after), MAX_BACKOFF_SECONDS)
+        except ValueError:
+            pass  # HTTP-date form, fall back to our own backoff
+    return min(2 ** attempt + random.random(), MAX_BACKOFF_SECONDS)
+
+def _retry(fn, *args, **kwargs):
+    """Calls fn, retrying Drive rate-limit and transient server errors up to MAX_ATTEMPTS times."""
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            return fn(*args, **kwargs)
+        except HttpError as e:
+            status, retry_after = e.resp.status, e.resp.get('retry-after')
+            if status not in RETRYABLE_STATUSES or attempt == MAX_ATTEMPTS - 1:
+                raise
+        except requests.HTTPError as e:
+            status, retry_after = e.response.status_code, e.response.headers.get('Retry-After')
+            if status not in RETRYABLE_STATUSES or attempt == MAX_ATTEMPTS - 1:
+                raise
+        delay = backoff_delay(attempt, retry_after)
+        logger.warning("Drive returned HTTP %s, retrying in %.1f s", status, delay)
+        time.sleep(delay)
 
 def authenticate_google_drive():
-    """Authenticates and returns Google Drive API service."""
+    """Authenticates and returns Google Drive API credentials."""
     creds = None
     if os.path.exists('token.json'):
         creds = Credentials.from_authorized_user_file('token.json', SCOPES)
@@ -54,67 +149,324 @@ def authenticate_google_drive():
         with open('token.json', 'w') as token:
             token.write(creds.to_json())
 
-    return build('drive', 'v3', credentials=creds)
-
-def list_files_in_folder(service, folder_id, shared_drive_id):
-    """Lists all files and folders inside a given folder."""
-    results = service.files().list(
-        q=f"'{folder_id}' in parents",
-        fields="nextPageToken, files(id, name, mimeType, name)",
-        corpora="drive",
-        driveId=shared_drive_id,
-        includeItemsFromAllDrives=True,
-        supportsAllDrives=True
-    ).execute()
-
-    return results.get('files', [])
-
-def get_video_duration(service, file_id, filename, detailed_log_file):
-    """Downloads the video file temporarily and gets its duration."""
-    request = service.files().get_media(fileId=file_id)
-    fh = io.BytesIO()
-    downloader = MediaIoBaseDownload(fh, request)
-    done = False
-    while not done:
-        status, done = downloader.next_chunk()
-    
-    fh.seek(0)
-    temp_filename = f'temp_video.{filename.split(".")[-1]}'
-    with open(temp_filename, 'wb') as f:
-        f.write(fh.read())
-
-    clip = VideoFileClip(temp_filename)
-    duration = clip.duration
-    clip.close()
-    
-    os.remove(temp_filename)
-    
+    return creds
+
+class DriveToken:
+    """Hands out the bearer token for the aiohttp requests, refreshing it when it is about to expire."""
+    def __init__(self, creds):
+        self.creds = creds
+        self._refresh_lock = asyncio.Lock()
+
+    def _needs_refresh(self, stale_token):
+        creds = self.creds
+        if not creds.valid or creds.token == stale_token:
+            return True
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)  # expiry is naive UTC
+        return creds.expiry is not None and creds.expiry - now < TOKEN_REFRESH_MARGIN
+
+    async def get(self, stale_token=None):
+        """Returns a current token; stale_token is one the API just rejected, it is never returned again."""
+        if self._needs_refresh(stale_token):
+            async with self._refresh_lock:
+                # Concurrent callers wait here; only the first one actually refreshes
+                if self._needs_refresh(stale_token):
+                    await asyncio.to_thread(self.creds.refresh, Request())
+                    logger.info("Refreshed the Drive access token")
+        return self.creds.token
+
+@contextlib.asynccontextmanager
+async def drive_get(session, drive_token, url, params):
+    """GETs a Drive API URL with a current token; a 401 is retried once with a refreshed token."""
+    token = await drive_token.get()
+    for attempt in range(2):
+        async with session.get(url, params=params, headers={"Authorization": f"Bearer {token}"}) as resp:
+            if resp.status == 401 and attempt == 0:
+                token = await drive_token.get(stale_token=token)
+                continue
+            yield resp
+            return
+
+async def list_files_in_folders(session, drive_token, semaphore, folder_ids, shared_drive_id):
+    """Lists all files and folders inside any of the given folders, following every result page."""
+    parents_query = " or ".join(f"'{folder_id}' in parents" for folder_id in folder_ids)
+    params = {
+        "q": f"({parents_query}) and ({LISTED_MIME_TYPES_QUERY}) and trashed=false",
+        "fields": ("nextPageToken, files(id, name, mimeType, parents, modifiedTime, videoMediaMetadata/durationMillis, "
+                   "shortcutDetails/targetId, shortcutDetails/targetMimeType)"),
+        "corpora": "drive",
+        "driveId": shared_drive_id,
+        "includeItemsFromAllDrives": "true",
+        "supportsAllDrives": "true",
+        "pageSize": "1000",
+    }
+    files = []
+    attempt = 0
+    while True:
+        async with semaphore:
+            async with drive_get(session, drive_token, DRIVE_FILES_URL, params) as resp:
+                retry_after = resp.headers.get('Retry-After')
+                if resp.status not in RETRYABLE_STATUSES or attempt == MAX_ATTEMPTS - 1:
+                    resp.raise_for_status()
+                    results = orjson.loads(await resp.read()) if orjson else await resp.json()
+                else:
+                    results = None
+        if results is None:
+            # Back off outside the semaphore so other requests can use the slot
+            delay = backoff_delay(attempt, retry_after)
+            logger.warning("Drive returned HTTP %s, retrying in %.1f s", resp.status, delay)
+            attempt += 1
+            await asyncio.sleep(delay)
+            continue
+        attempt = 0
+        files.extend(results.get('files', []))
+        page_token = results.get('nextPageToken')
+        if not page_token:
+            return files
+        params["pageToken"] = page_token
+
+def open_duration_cache(path):
+    """Opens the on-disk duration cache, creating its table on first use."""
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE IF NOT EXISTS dur(id TEXT PRIMARY KEY, mtime TEXT, seconds REAL)")
+    return conn
+
+def get_cached_duration(duration_cache, file):
+    """Returns the cached duration of a file, or None if it is unknown or the file changed since."""
+    row = duration_cache.execute(
+        "SELECT seconds FROM dur WHERE id=? AND mtime=?", (file['id'], file.get('modifiedTime'))
+    ).fetchone()
+    return row[0] if row else None
+
+def store_duration(duration_cache, file, seconds):
+    if file.get('modifiedTime') is None:
+        return  # Shortcut targets come without modifiedTime, don't clobber the real entry
+    duration_cache.execute(
+        "INSERT OR REPLACE INTO dur(id, mtime, seconds) VALUES (?, ?, ?)",
+        (file['id'], file.get('modifiedTime'), seconds)
+    )
+
+def fetch_video_metadata(service, file_ids):
+    """
+    Fetches videoMediaMetadata for many files, combining up to MAX_BATCH_REQUESTS calls per HTTP request.
+    Calls inside a batch that were rate limited are sent again in a new batch after a backoff.
+    """
+    metadata = {}
+    throttled = []
+
+    def on_response(request_id, response, exception):
+        if exception is None:
+            metadata[request_id] = response.get('videoMediaMetadata', {})
+        elif isinstance(exception, HttpError) and exception.resp.status in RETRYABLE_STATUSES:
+            throttled.append(request_id)
+
+    for attempt in range(MAX_ATTEMPTS):
+        for start in range(0, len(file_ids), MAX_BATCH_REQUESTS):
+            batch = service.new_batch_http_request(callback=on_response)
+            for file_id in file_ids[start:start + MAX_BATCH_REQUESTS]:
+                batch.add(service.files().get(fileId=file_id, fields='videoMediaMetadata', supportsAllDrives=True),
+                          request_id=file_id)
+            _retry(batch.execute)
+        if not throttled or attempt == MAX_ATTEMPTS - 1:
+            break
+        file_ids, throttled = throttled, []
+        time.sleep(backoff_delay(attempt))
+    return metadata
+
+def get_video_duration(download_session, file_id, filename):
+    """
+    Streams the video file from Drive straight into ffprobe and gets its duration.
+    The download stops as soon as ffprobe has read what it needs.
+    """
+    process = subprocess.Popen(
+        ["ffprobe", "-v", "quiet", "-print_format", "json", "-show_format", "pipe:0"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    try:
+        with download_session.get(f"{DRIVE_FILES_URL}/{file_id}",
+                                  params={"alt": "media", "supportsAllDrives": "true"}, stream=True) as response:
+            response.raise_for_status()
+            try:
+                for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    process.stdin.write(chunk)
+            except BrokenPipeError:
+                pass  # ffprobe exited once it found the duration, stop downloading
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        output = process.stdout.read()
+        process.wait()
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+    if process.returncode != 0:
+        raise RuntimeError(f"ffprobe could not read {filename} (exit code {process.returncode})")
+    video_format = json.loads(output)["format"]
+
     # Log detailed video metadata separately
-    log_message(detailed_log_file, f"🔍 Detailed metadata for {filename}:\n{clip.__dict__}", None, None)
+    detail_logger.debug("🔍 Detailed metadata for %s:\n%s", filename, video_format)
 
-    return duration
+    return float(video_format["duration"])
 
-def traverse_folder(service, folder_id, shared_drive_id, folder_name, log_file, detailed_log_file):
-    """Recursively traverses a folder, processes video files, and returns total duration."""
-    total_duration = 0
-    files = list_files_in_folder(service, folder_id, shared_drive_id)
+async def traverse_folder(session, drive_token, service, download_session, duration_cache, root_folder_id, shared_drive_id, root_folder_name):
+    """
+    Walks the folder tree breadth-first, listing the children of up to BATCH_SIZE
+    folders per API call with all batches of a level in flight at once, processes
+    video files, and returns total duration.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    folder_names = {root_folder_id: root_folder_name}
+    folder_index = {root_folder_id: 0}  # folder id -> position in folder_order
+    folder_order = [root_folder_id]  # Discovery order, parents always before children
+    parent_index = [-1]  # Position of each folder's parent in folder_order
+    video_millis = []  # Durations Drive reported in the listing...
+    video_folder_index = []  # ...and the position of the folder holding each of them
+    pending = deque([root_folder_id])
+    seen_videos = set()  # Ids of the real video files already counted
+    videos_without_duration = []  # (file, parent folder id) pairs the listing had no duration for
+    shortcut_targets = []  # (target video, shortcut's folder id) pairs, resolved once the whole tree is known
 
-    log_message(log_file, f"\n📁 Entering folder: {folder_name}")
+    while pending:
+        # Request every batch of the current tree level concurrently
+        batches = []
+        while pending:
+            batch = [pending.popleft() for _ in range(min(BATCH_SIZE, len(pending)))]
+            for folder_id in batch:
+                logger.debug("📁 Entering folder: %s", folder_names[folder_id])
+            batches.append(batch)
+        results = await asyncio.gather(
+            *(list_files_in_folders(session, drive_token, semaphore, batch, shared_drive_id) for batch in batches)
+        )
 
-    for file in files:
-        if file['mimeType'] == 'application/vnd.google-apps.folder':  # If it's a folder, recurse
-            total_duration += traverse_folder(service, file['id'], shared_drive_id, file['name'], log_file, detailed_log_file)
-        elif file['mimeType'] in ['video/mp4', 'video/quicktime']:  # Process only .mp4 and .mov files
-            log_message(log_file, f"🎬 Processing video: {file['name']}...")
-            duration = get_video_duration(service, file['id'], file['name'], detailed_log_file)
-            log_message(log_file, f"✅ Duration: {format_time_hms(duration)}")
-            total_duration += duration
-    
-    log_message(log_file, f"📊 Folder '{folder_name}' has {format_time_hms(total_duration)} of video content.")
-    return total_duration
+        for batch, files in zip(batches, results):
+            batch_ids = set(batch)
+            for file in files:
+                parent_id = next(p for p in file.get('parents', []) if p in batch_ids)
+                if file['mimeType'] == SHORTCUT_MIME_TYPE:
+                    details = file.get('shortcutDetails', {})
+                    if details.get('targetMimeType') in VIDEO_MIME_TYPES:
+                        # The target may still turn up as a real file later in the walk, decided afterwards
+                        shortcut_targets.append(({'id': details['targetId'], 'name': file['name'],
+                                                  'mimeType': details['targetMimeType']}, parent_id))
+                    continue
+                if file['mimeType'] == FOLDER_MIME_TYPE:  # Queue sub-folders for the next level
+                    if file['id'] in folder_index:
+                        continue
+                    folder_names[file['id']] = file['name']
+                    folder_index[file['id']] = len(folder_order)
+                    folder_order.append(file['id'])
+                    parent_index.append(folder_index[parent_id])
+                    pending.append(file['id'])
+                elif file['mimeType'] in VIDEO_MIME_TYPES:  # Process only .mp4 and .mov files
+                    if file['id'] in seen_videos:
+                        logger.debug("Skipping %s, already counted", file['name'])
+                        continue
+                    seen_videos.add(file['id'])
+                    logger.info("🎬 Processing video: %s...", file['name'])
+                    duration_millis = file.get('videoMediaMetadata', {}).get('durationMillis')
+                    if duration_millis is None:
+                        # Not processed by Drive yet (e.g. fresh upload), resolved after the walk
+                        videos_without_duration.append((file, parent_id))
+                        continue
+                    # Drive already knows the duration, no need to download the video
+                    video_millis.append(int(duration_millis))
+                    video_folder_index.append(folder_index[parent_id])
+                    detail_logger.debug("🔍 Drive video metadata for %s:\n%s", file['name'], file['videoMediaMetadata'])
+                    logger.info("✅ Duration: %s", format_time_hms(video_millis[-1] / 1000))
+
+    # A shortcut only counts when its target lives outside the tree; otherwise the real file's folder has it
+    shortcut_ids = set()
+    for file, parent_id in shortcut_targets:
+        if file['id'] in seen_videos or file['id'] in shortcut_ids:
+            logger.debug("Skipping shortcut %s, its target is already counted", file['name'])
+            continue
+        shortcut_ids.add(file['id'])
+        logger.info("🎬 Processing shortcut: %s...", file['name'])
+        videos_without_duration.append((file, parent_id))
+
+    # Sum the listed durations per folder in one vectorized pass
+    durations = np.fromiter(video_millis, dtype=np.int64, count=len(video_millis))
+    folder_idx = np.fromiter(video_folder_index, dtype=np.intp, count=len(video_folder_index))
+    folder_totals = np.bincount(folder_idx, weights=durations, minlength=len(folder_order)) / 1000.0
+
+    if videos_without_duration:
+        # Reuse durations from earlier runs, ask Drive again for the rest in batched
+        # requests, and download only what is still missing
+        cached_durations = {}
+        for file, _ in videos_without_duration:
+            cached = get_cached_duration(duration_cache, file)
+            if cached is not None:
+                cached_durations[file['id']] = cached
+        uncached_ids = [file['id'] for file, _ in videos_without_duration if file['id'] not in cached_durations]
+        metadata = fetch_video_metadata(service, uncached_ids) if uncached_ids else {}
+
+        new_entries = 0
+        for file, parent_id in videos_without_duration:
+            duration = cached_durations.get(file['id'])
+            if duration is None:
+                duration_millis = metadata.get(file['id'], {}).get('durationMillis')
+                if duration_millis is not None:
+                    duration = int(duration_millis) / 1000
+                elif file['id'] in shortcut_ids:
+                    # The target may be deleted or not shared with us; that is no reason to abort the scan
+                    try:
+                        duration = _retry(get_video_duration, download_session, file['id'], file['name'])
+                    except (requests.HTTPError, RuntimeError) as e:
+                        logger.warning("Skipping shortcut %s, its target could not be read: %s", file['name'], e)
+                        continue
+                else:
+                    duration = _retry(get_video_duration, download_session, file['id'], file['name'])
+                store_duration(duration_cache, file, duration)
+                new_entries += 1
+                if new_entries % CACHE_COMMIT_EVERY == 0:
+                    duration_cache.commit()
+            logger.info("✅ Duration of %s: %s", file['name'], format_time_hms(duration))
+            folder_totals[folder_index[parent_id]] += duration
+
+    # Roll totals up from the deepest folders so each folder reports its whole subtree
+    for index in range(len(folder_order) - 1, -1, -1):
+        total_duration = folder_totals[index]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📊 Folder '%s' has %s of video content.", folder_names[folder_order[index]], format_time_hms(total_duration))
+        if parent_index[index] >= 0:
+            folder_totals[parent_index[index]] += total_duration
+
+    return float(folder_totals[0])
+
+async def scan_shared_drive(creds, root_folder_id, shared_drive_id, root_folder_name):
+    """Opens an authorized HTTP session and returns the total duration under the root folder."""
+    # The API client and the blocking session are only needed for videos the listing has no duration for
+    service = build('drive', 'v3', credentials=creds)
+    download_session = AuthorizedSession(creds)
+    duration_cache = open_duration_cache(DURATION_CACHE_DB)
+    drive_token = DriveToken(creds)
+    try:
+        async with aiohttp.ClientSession() as session:
+            return await traverse_folder(session, drive_token, service, download_session, duration_cache, root_folder_id,
+                                         shared_drive_id, root_folder_name)
+    finally:
+        duration_cache.commit()
+        duration_cache.close()
+
+def run_scan(creds, root_folder_id, shared_drive_id, root_folder_name):
+    """Scans the Shared Drive and logs the start, total and end of the run."""
+    start_time = datetime.datetime.now()
+    logger.info("🚀 The log is starting at %s on %s", start_time.strftime('%H:%M:%S'), start_time.strftime('%Y-%m-%d'))
+    detail_logger.info("🛠 Detailed Log for Debugging\n🚀 Started at %s on %s", start_time.strftime('%H:%M:%S'), start_time.strftime('%Y-%m-%d'))
+
+    logger.info("🔍 Scanning Shared Drive (ID: %s) for .mp4 and .mov videos...", shared_drive_id)
+    total_duration = asyncio.run(scan_shared_drive(creds, root_folder_id, shared_drive_id, root_folder_name))
+
+    end_time = datetime.datetime.now()
+    logger.info("🎥 Total video content in Shared Drive: %s", format_time_hms(total_duration))
+    logger.info("🛑 The log ends at %s on %s", end_time.strftime('%H:%M:%S'), end_time.strftime('%Y-%m-%d'))
+
+    detail_logger.info("🛑 Detailed log ends at %s on %s", end_time.strftime('%H:%M:%S'), end_time.strftime('%Y-%m-%d'))
 
 def main():
-    service = authenticate_google_drive()
+    creds = authenticate_google_drive()
 
     # Replace with your actual Shared Drive ID and root folder ID
     shared_drive_id = '0AHxy0uU6Xa9yUk9PVA'  
@@ -126,20 +478,12 @@ def main():
     root_folder_id = '18nRASqAiHLPxevUux6dQbwwbIwyM1pBW' # Manual Dubbing
     root_folder_name = "Manual dubbing"  # Replace with actual root folder name
 
-    log_file, detailed_log_file = get_log_filenames(shared_drive_id, root_folder_name)
-
-    start_time = datetime.datetime.now()
-    log_message(log_file, f"\n🚀 The log is starting at {start_time.strftime('%H:%M:%S')} on {start_time.strftime('%Y-%m-%d')}")
-    log_message(detailed_log_file, f"🛠 Detailed Log for Debugging\n🚀 Started at {start_time.strftime('%H:%M:%S')} on {start_time.strftime('%Y-%m-%d')}")
-
-    log_message(log_file, f"\n🔍 Scanning Shared Drive (ID: {shared_drive_id}) for .mp4 and .mov videos...")
-    total_duration = traverse_folder(service, root_folder_id, shared_drive_id, root_folder_name, log_file, detailed_log_file)
-
-    end_time = datetime.datetime.now()
-    log_message(log_file, f"\n🎥 Total video content in Shared Drive: {format_time_hms(total_duration)}")
-    log_message(log_file, f"\n🛑 The log ends at {end_time.strftime('%H:%M:%S')} on {end_time.strftime('%Y-%m-%d')}\n")
-
-    log_message(detailed_log_file, f"\n🛑 Detailed log ends at {end_time.strftime('%H:%M:%S')} on {end_time.strftime('%Y-%m-%d')}\n")
+    log_path, detailed_log_path = get_log_filenames(shared_drive_id, root_folder_name)
+    listener = setup_logging(log_path, detailed_log_path)
+    try:
+        run_scan(creds, root_folder_id, shared_drive_id, root_folder_name)
+    finally:
+        listener.stop()
 
 if __name__ == '__main__':
     main()
@@ -1,12 +1,12 @@
 import os
 import io
+import subprocess
 import google.auth
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
-from moviepy import VideoFileClip
 
 # Google Drive API Scope
 SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
@@ -56,9 +56,12 @@ def get_video_duration(service, file_id):
     with open(temp_filename, 'wb') as f:
         f.write(fh.read())
 
-    clip = VideoFileClip(temp_filename)
-    duration = clip.duration
-    clip.close()
+    # ffprobe only reads the container header, no decoders are set up
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=nw=1:nk=1', temp_filename],
+        capture_output=True, check=True
+    )
+    duration = float(result.stdout)
     
     os.remove(temp_filename)
     return duration
@@ -4,60 +4,390 @@ import sys
 import os
 import re
 import logging
+import logging.handlers
+import atexit
+import queue
 import datetime
 import json
-import pandas as pd
+import functools
+import html
+import operator
+import random
+from collections import Counter
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import importlib.metadata  # For getting package versions
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QTabWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QFileDialog, QComboBox, QTableWidget,
-    QTableWidgetItem, QMessageBox, QTextEdit, QProgressBar, QCheckBox, QHeaderView,
+    QTableWidgetItem, QTableView, QMessageBox, QTextEdit, QProgressBar, QCheckBox, QHeaderView,
     QSpacerItem, QSizePolicy, QDialog, QDialogButtonBox, QFormLayout
 )
-from PyQt5.QtCore import Qt, QDir
-from PyQt5.QtGui import QColor
+from PyQt5.QtCore import (
+    Qt, QDir, QObject, QFileSystemWatcher, QAbstractTableModel, QModelIndex, QThread, QTimer, QEventLoop, pyqtSignal
+)
+from PyQt5.QtGui import QBrush, QColor
 
 # Google API imports
-# pip install google-api-python-client google-auth-oauthlib google-auth-httplib2 pandas openpyxl
-from google_auth_oauthlib.flow import InstalledAppFlow  # Import the base class
-from googleapiclient.discovery import build
+# pip install google-api-python-client google-auth-oauthlib google-auth-httplib2 openpyxl
+# The discovery client, the OAuth flow, Credentials and Request (which pull in requests and
+# the discovery machinery) are imported where they are first used, to keep startup fast
 from googleapiclient.errors import HttpError
-from google.oauth2.credentials import Credentials
-from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
+
+try:
+    import orjson  # Faster JSON parsing of the channel config, optional
+except ImportError:
+    orjson = None
+
+try:
+    from diskcache import Cache  # On-disk cache of playlist listings, optional
+except ImportError:
+    Cache = None
+
+try:
+    import pyexcelerate  # Writes a whole sheet of plain values in one call, fastest Excel export, optional
+except ImportError:
+    pyexcelerate = None
+
+try:
+    import xlsxwriter  # Writes the Excel exports several times faster than openpyxl, optional
+except ImportError:
+    xlsxwriter = None
 
 # --- Constants ---
 SCOPES = ['https://www.googleapis.com/auth/youtube.force-ssl']
 CONFIG_FILE = "channel_config.json"
+CONFIG_SAVE_DELAY_MS = 500  # Profile changes within this window are written to disk once
+EXCEL_MAX_PAGES = 20  # Pages of 50 items fetched per playlist for the Excel export
+EXCEL_FETCH_WORKERS = 4  # Playlists whose items are fetched at the same time for the Excel export
+EXCEL_ZIP_COMPRESSLEVEL = 1  # zlib level of the openpyxl export; about half the CPU of the default 6, ~10% larger files
+EXCEL_COLUMNS = ('CourseCode', 'Chapter Name', 'Youtubeurl', 'Video Title', 'Video Description',
+                 'OrderNo in Chapter', 'Language code')
+LOG_FLUSH_LINES = 20  # Rename log lines buffered before they are appended to the log window
+TABLE_ROW_HEIGHT = 24  # Fixed row height of the single-line tables, instead of measuring every row
 TOKENS_DIR = "tokens"  # Subdirectory for token files
+REQUIRED_PROFILE_KEYS = ('name', 'api_key', 'client_secret_path', 'token_path')
+API_BATCH_SIZE = 50  # Max IDs per videos.list call
+# Partial-response selectors: the API only returns the fields each call site reads
+PLAYLISTS_FIELDS = "etag,nextPageToken,items(id,snippet(title,description),contentDetails/itemCount)"
+# Every Excel column comes from playlistItems; per-video fields would need _fetch_video_snippets
+PLAYLIST_ITEMS_FIELDS = "nextPageToken,items(snippet(title,description,position),contentDetails/videoId)"
+PLAYLIST_TITLES_FIELDS = "etag,nextPageToken,items/snippet/title"
+VIDEO_SNIPPETS_FIELDS = "items(id,snippet(title,description,categoryId,tags,defaultLanguage,defaultAudioLanguage))"
+PRESERVED_SNIPPET_KEYS = ("categoryId", "tags", "defaultLanguage", "defaultAudioLanguage")
+RENAME_WORKERS = 8  # Concurrent videos.update calls while renaming
+API_MIN_INTERVAL = 0.1  # Minimum seconds between the starts of two API calls
+API_MAX_ATTEMPTS = 5  # Tries per API call before a transient error is reported
+API_MAX_BACKOFF = 32  # Seconds, cap of the exponential backoff between tries
+API_HTTP_TIMEOUT = 60  # Seconds a worker's API call may wait on the socket, like build()'s own http
+RETRYABLE_STATUSES = (429, 500, 503)
+# Per-minute limits clear after a short wait; the daily quotaExceeded does not, so it is not retried
+RETRYABLE_REASONS = (b'rateLimitExceeded', b'userRateLimitExceeded')
+API_CACHE_DIR = ".yt_cache"  # Cached playlist listings of the checking tab
+PLAYLISTS_CACHE_TTL = 24 * 3600  # Seconds a cached channel playlist listing is used without asking the API
+PLAYLIST_ITEMS_CACHE_TTL = 7 * 24 * 3600  # Same for the titles of a playlist
+
+# Status/background colors, parsed once instead of at every call site
+_COL_BLACK = QColor("black")
+_COL_DARKGRAY = QColor("darkGray")
+_COL_GREEN = QColor("green")
+_COL_RED = QColor("red")
+_COL_ORANGE = QColor("orange")
+_COL_BLUE = QColor("blue")
+_COL_MISMATCH = QColor(255, 192, 203)
+# Views paint BackgroundRole with a QBrush; one shared brush saves a conversion per painted cell
+_BRUSH_MISMATCH = QBrush(_COL_MISMATCH)
 
 # --- Helper function to sanitize filenames ---
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_ONLY_DOTS_RE = re.compile(r'^\.+$')
+_RESERVED_FILENAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5',
+    'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5',
+    'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
+
+@functools.lru_cache(maxsize=512)
 def sanitize_filename(name, replace_spaces=True):
     """Removes characters that are invalid in filenames/paths."""
     if not name:
         return "untitled"
-    name = re.sub(r'[<>:"/\\|?*]', '', name)
+    name = _INVALID_FILENAME_CHARS_RE.sub('', name)
     name = name.strip()
     if replace_spaces:
-        name = re.sub(r'\s+', '_', name)
-    if re.match(r'^\.+$', name) or name.upper() in ['CON', 'PRN', 'AUX', 'NUL', 
-                                                     'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 
-                                                     'COM6', 'COM7', 'COM8', 'COM9', 
-                                                     'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 
-                                                     'LPT6', 'LPT7', 'LPT8', 'LPT9']:
+        name = _WHITESPACE_RE.sub('_', name)
+    if _ONLY_DOTS_RE.match(name) or name.upper() in _RESERVED_FILENAMES:
         name = "_" + name
     return name[:150]
 
-# --- Custom Flow Class to Force Account Selection ---
-class ForceAccountSelectionFlow(InstalledAppFlow):
+# --- Chapter-aware sorting of video titles ---
+_CHAPTER_RE = re.compile(r'chapter\s+(\d+)([A-Za-z]*)')
+# One match per title: either it mentions the course introduction anywhere, or it
+# starts with 'Chapter N' followed by an optional dash and the topic
+_RENAME_TITLE_RE = re.compile(
+    r'(?P<intro>(?s:.*?)course introduction)|(?P<ch>Chapter\s+\d+[A-Za-z]?)\s*[-–—]?\s*(?P<topic>.*)',
+    re.IGNORECASE
+)
+
+# Excel export playlists are titled PL_<course code>_<language code>
+_PL_CODE_RE = re.compile(r'PL_([^_]+(?:_[^_]+)*)_([a-zA-Z0-9]+)', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=4096)
+def chapter_sort_key(title):
+    """
+    Generates a sort key tuple (num, subsort, suffix)
+    Handles 'Course Introduction', 'Chapter N', 'Chapter NA'.
+    Titles are not part of the key; sorts are stable, so ties keep their input order.
     """
-    An InstalledAppFlow subclass that always adds 'prompt=select_account'
-    to the authorization URL, forcing the Google account chooser screen.
+    if not title:
+        return (999, 0, "")
+    title_lower_stripped = title.lower().strip()
+    if "course introduction" in title_lower_stripped:
+        return (-1, 0, "")
+    m = _CHAPTER_RE.search(title_lower_stripped)
+    if m:
+        num, suffix = int(m.group(1)), m.group(2).upper()
+        subsort = 0 if not suffix else 1
+        return (num, subsort, suffix)
+    return (999, 0, "")
+
+def check_list_sort_key(title):
     """
-    def authorization_url(self, **kwargs):
-        """Generates the authorization URL with prompt=select_account."""
-        kwargs['prompt'] = 'select_account'
-        logging.debug(f"Generating authorization URL with forced prompt: select_account, kwargs: {kwargs}")
-        return super().authorization_url(**kwargs)
+    Chapter order with the title as tie-breaker, for the checking tab's two columns:
+    they are compared row by row, so equal names must land on the same row in both.
+    """
+    return (chapter_sort_key(title), title.lower())
+
+# --- Concurrent API Calls ---
+class RateLimiter:
+    """Spaces calls at least min_interval seconds apart, across all threads."""
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_ok = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_ok - now
+            self._next_ok = max(now, self._next_ok) + self.min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+_api_rate_limiter = RateLimiter(API_MIN_INTERVAL)
+
+def _is_retryable(e):
+    """True for HttpErrors worth retrying: throttling and transient server errors."""
+    if e.resp.status in RETRYABLE_STATUSES:
+        return True
+    return e.resp.status == 403 and any(reason in (e.content or b'') for reason in RETRYABLE_REASONS)
+
+def _execute_with_retry(request, http=None, max_attempts=API_MAX_ATTEMPTS):
+    """Executes an API request under the shared rate limit, backing off exponentially on transient errors."""
+    for attempt in range(max_attempts):
+        _api_rate_limiter.wait()
+        try:
+            return request.execute(http=http)
+        except HttpError as e:
+            if attempt == max_attempts - 1 or not _is_retryable(e):
+                raise
+            delay = min(API_MAX_BACKOFF, 2 ** attempt) + random.uniform(0, 1)
+            logging.warning(f"API {e.resp.status} on {request.methodId}, retry {attempt + 1} in {delay:.1f}s")
+            time.sleep(delay)
+
+def _http_error_details(e):
+    """Returns the error message from a JSON HttpError body, or '' if the body is not JSON."""
+    if not e.content or not e.resp.get("content-type", "").startswith("application/json"):
+        return ""
+    try:
+        return json.loads(e.content).get("error", {}).get("message", "")
+    except (ValueError, AttributeError):
+        logging.debug("Unparseable JSON error body", exc_info=True)
+        return ""
+
+def _list_all_pages(list_method, max_pages, etag=None, http=None, **list_kwargs):
+    """
+    Fetches up to max_pages pages of a list call. Returns a cache entry dict
+    {items, hit_limit, etag, pages}, or None if etag was given and the first
+    page answered 304 Not Modified.
+    """
+    items, next_token, first_etag, page = [], None, None, 0
+    for page in range(1, max_pages + 1):
+        req = list_method(pageToken=next_token, **list_kwargs)
+        if page == 1 and etag:
+            req.headers['If-None-Match'] = etag
+        try:
+            resp = _execute_with_retry(req, http=http)
+        except HttpError as e:
+            if page == 1 and etag and e.resp.status == 304:
+                return None
+            raise
+        if page == 1:
+            first_etag = resp.get("etag")
+        items.extend(resp.get("items", []))
+        next_token = resp.get("nextPageToken")
+        if not next_token:
+            break
+    return {"items": items, "hit_limit": bool(next_token), "etag": first_etag, "pages": page}
+
+_api_cache = Cache(API_CACHE_DIR) if Cache is not None else None
+
+def _cached_list(cache_key, fetch, ttl, revalidate=False):
+    """
+    Returns (items, hit_limit) of a paged listing through the on-disk cache.
+    Entries younger than ttl are returned without a request, unless revalidate
+    is set. Other single-page entries are revalidated with their ETag;
+    fetch(etag) returns a fresh entry (see _list_all_pages) or None when the
+    cached one is still current.
+    """
+    entry = _api_cache.get(cache_key) if _api_cache is not None else None
+    if entry and not revalidate and time.time() - entry["fetched"] < ttl:
+        logging.debug("Cache hit %s", cache_key)
+        return entry["items"], entry["hit_limit"]
+    # An ETag only covers its own page, so longer listings are always fetched again
+    result = fetch(entry["etag"] if entry and entry["pages"] == 1 else None)
+    if result is None:
+        logging.debug("Cache revalidated %s", cache_key)
+        result = entry
+    result["fetched"] = time.time()
+    if _api_cache is not None:
+        _api_cache.set(cache_key, result, expire=ttl * 4)  # Kept past ttl for ETag revalidation
+    return result["items"], result["hit_limit"]
+
+def _invalidate_cached_list(cache_key):
+    if _api_cache is not None:
+        _api_cache.delete(cache_key)
+_thread_http = threading.local()
+
+def _thread_authorized_http(credentials):
+    """Returns the calling thread's AuthorizedHttp; httplib2 connections cannot be shared between threads."""
+    if getattr(_thread_http, 'credentials', None) is not credentials:
+        _thread_http.http = AuthorizedHttp(credentials, http=httplib2.Http(timeout=API_HTTP_TIMEOUT))
+        _thread_http.credentials = credentials
+    return _thread_http.http
+
+def _fetch_video_snippets(videos_resource, video_ids, http):
+    """Returns { video_id: snippet } for video_ids, API_BATCH_SIZE IDs per videos.list call."""
+    snippets = {}
+    for i in range(0, len(video_ids), API_BATCH_SIZE):
+        req = videos_resource.list(part="snippet", id=",".join(video_ids[i:i + API_BATCH_SIZE]),
+                                   maxResults=API_BATCH_SIZE, fields=VIDEO_SNIPPETS_FIELDS)
+        resp = _execute_with_retry(req, http=http)
+        snippets.update((item["id"], item["snippet"]) for item in resp.get("items", []))
+    return snippets
+
+def _do_rename(videos_resource, credentials, body):
+    """Sends one videos.update from a worker thread, respecting the shared rate limit."""
+    return _execute_with_retry(videos_resource.update(part="snippet", body=body), http=_thread_authorized_http(credentials))
+
+# --- Excel Export ---
+def _write_excel_rows(path, rows):
+    """
+    Writes a single-sheet xlsx file: a header row of EXCEL_COLUMNS, then rows (sequences in that order).
+    rows may be any iterable; only pyexcelerate needs it as one list, the other writers stream it.
+    """
+    if pyexcelerate is not None:
+        workbook = pyexcelerate.Workbook()
+        workbook.new_sheet("Sheet1", data=[EXCEL_COLUMNS, *rows])
+        workbook.save(path)
+    elif xlsxwriter is not None:
+        # Cell text is written as is, like openpyxl does, not turned into formulas or hyperlinks.
+        # Rows are written strictly in order, so constant_memory can flush each one to disk as it goes
+        workbook = xlsxwriter.Workbook(path, {'constant_memory': True,
+                                              'strings_to_formulas': False, 'strings_to_urls': False})
+        sheet = workbook.add_worksheet("Sheet1")
+        sheet.write_row(0, 0, EXCEL_COLUMNS)
+        for row_num, row in enumerate(rows, 1):
+            sheet.write_row(row_num, 0, row)
+        workbook.close()
+    else:
+        import openpyxl
+        from openpyxl.writer.excel import ExcelWriter
+        # Write-only mode streams the rows out instead of keeping a Cell object per value
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet("Sheet1")
+        sheet.append(EXCEL_COLUMNS)
+        for row in rows:
+            sheet.append(row)
+        # workbook.save() always deflates at the default level; hand openpyxl's writer our own archive instead
+        try:
+            with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True,
+                                 compresslevel=EXCEL_ZIP_COMPRESSLEVEL) as archive:
+                ExcelWriter(workbook, archive).save()
+        except Exception:
+            # A half-written archive is not a readable workbook, don't leave it behind
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+
+# --- Token File Persistence ---
+def _atomic_write_token(path, creds):
+    """Writes creds to path via a temp file and os.replace, so a crash never leaves a truncated token."""
+    data = creds.to_json().encode('utf-8')
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+# --- Custom Flow Class to Force Account Selection ---
+@functools.lru_cache(maxsize=None)
+def force_account_selection_flow():
+    """Returns the ForceAccountSelectionFlow class, importing google_auth_oauthlib on first use."""
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
+    class ForceAccountSelectionFlow(InstalledAppFlow):
+        """
+        An InstalledAppFlow subclass that always adds 'prompt=select_account'
+        to the authorization URL, forcing the Google account chooser screen.
+        """
+        def authorization_url(self, **kwargs):
+            """Generates the authorization URL with prompt=select_account."""
+            kwargs['prompt'] = 'select_account'
+            logging.debug("Generating authorization URL with forced prompt: select_account, kwargs: %s", kwargs)
+            return super().authorization_url(**kwargs)
+    return ForceAccountSelectionFlow
+
+# --- Worker for the Browser OAuth Flow ---
+class OAuthWorker(QObject):
+    """Runs flow.run_local_server on a worker thread; emits (creds, None) or (None, exception)."""
+    finished = pyqtSignal(object, object)
+
+    def __init__(self, flow):
+        super().__init__()
+        self.flow = flow
+
+    def run(self):
+        try:
+            creds = self.flow.run_local_server(port=0)
+        except Exception as e:
+            self.finished.emit(None, e)
+            return
+        self.finished.emit(creds, None)
+
+class TaskWorker(QObject):
+    """Runs fn() on a worker thread; emits (result, None) or (None, exception)."""
+    finished = pyqtSignal(object, object)
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.finished.emit(None, e)
+            return
+        self.finished.emit(result, None)
 
 # --- Dialog for Adding/Editing Channel Profiles ---
 class ChannelDialog(QDialog):
@@ -145,10 +475,641 @@ class ChannelDialog(QDialog):
             "token_path": token_path
         }
 
+# --- Worker Thread for Paged List Calls ---
+class PagedListWorker(QThread):
+    """
+    Runs a paged YouTube list call (playlists, playlistItems) off the UI thread.
+    Each page's items are emitted as soon as they arrive; the next page can only
+    be requested with the previous page's token, so pages are fetched in order.
+    """
+    page_signal = pyqtSignal(list)
+    finished_signal = pyqtSignal(bool)  # True if max_pages was reached with pages left
+    error_signal = pyqtSignal(object)
+
+    def __init__(self, list_method, credentials, max_pages, **list_kwargs):
+        super().__init__()
+        self.list_method = list_method
+        self.credentials = credentials
+        self.max_pages = max_pages
+        self.list_kwargs = list_kwargs
+
+    def run(self):
+        # httplib2 is not thread-safe, so this thread gets its own connection
+        http = AuthorizedHttp(self.credentials, http=httplib2.Http(timeout=API_HTTP_TIMEOUT))
+        next_token = None
+        try:
+            for page in range(1, self.max_pages + 1):
+                resp = _execute_with_retry(self.list_method(pageToken=next_token, **self.list_kwargs), http=http)
+                items = resp.get("items", [])
+                logging.debug("Page %d (%d) of %s", page, len(items), self.list_kwargs)
+                self.page_signal.emit(items)
+                next_token = resp.get("nextPageToken")
+                if not next_token:
+                    break
+        except Exception as e:
+            self.error_signal.emit(e)
+            return
+        self.finished_signal.emit(bool(next_token))
+
+class RenameWorker(QObject):
+    """
+    Applies the proposed titles/descriptions on a worker thread. Per-row results
+    are reported through log/progress; the snippets it fetched or updated are
+    handed back through snippets_signal so the model's cache stays current.
+    """
+    progress = pyqtSignal(int)
+    log = pyqtSignal(str)
+    snippets_signal = pyqtSignal(dict)
+    finished = pyqtSignal(int, int, int)  # processed, ok, failed
+
+    def __init__(self, videos_resource, credentials, rows, snippets):
+        super().__init__()
+        self.videos_resource = videos_resource
+        self.credentials = credentials
+        self.rows = rows  # [(row_index, row_dict)]
+        self.snippets = snippets  # { video_id: snippet }, copies owned by this worker
+        self.counts = {"ok": 0, "fail": 0, "proc": 0}
+
+    def row_done(self, ok):
+        self.counts["ok" if ok else "fail"] += 1
+        self.counts["proc"] += 1
+        self.progress.emit(self.counts["proc"])
+
+    def run(self):
+        try:
+            self.fetch_missing_snippets()
+            self.apply_updates(self.build_updates())
+        except Exception as e:
+            logging.exception("Rename aborted.")
+            self.log.emit(f"<font color='red'>Rename aborted: {type(e).__name__}: {e}</font>")
+        self.snippets_signal.emit(self.snippets)
+        self.finished.emit(self.counts["proc"], self.counts["ok"], self.counts["fail"])
+
+    @staticmethod
+    def unchanged_since_load(data):
+        """True if the proposed title/desc equal what the playlist showed when the scheme was loaded."""
+        return (data["new_title"].strip(), data["new_desc"].strip()) == (data["orig_title"], data["orig_desc"])
+
+    def fetch_missing_snippets(self):
+        """
+        Snippets are normally cached when the scheme loads; fetch those still missing,
+        50 IDs per call. Rows left as loaded need no snippet, they are skipped.
+        """
+        vids = list(dict.fromkeys(data["vid"] for _, data in self.rows
+                                  if data["vid"] in self.snippets or not self.unchanged_since_load(data)))
+        missing = [vid for vid in vids if vid not in self.snippets]
+        self.snippets.update(_fetch_video_snippets(self.videos_resource, missing,
+                                                   _thread_authorized_http(self.credentials)))
+        logging.info(f"Fetched {len(missing)} of {len(vids)} snippets; the rest were cached.")
+
+    def build_updates(self):
+        """Checks every row against its current snippet; returns [((row, vid, new_t, new_d, chg_s), body)]."""
+        updates = []
+        for row, data in self.rows:
+            vid = None
+            try:
+                vid = data["vid"]
+                pos = data["pos"]
+                orig_t = data["orig_title"]
+                new_t = data["new_title"].strip()
+                new_d = data["new_desc"].strip()
+                if not vid:
+                    logging.warning(f"Row {row+1}({pos}): Skip miss ID.")
+                    self.row_done(False)
+                    continue
+                if not new_t:
+                    logging.warning(f"Row {row+1}({pos}): Skip {vid} empty title.")
+                    self.row_done(False)
+                    continue
+                self.log.emit(f"Proc {row+1}(ID:{vid}) '{orig_t[:50]}...'")
+                curr_snip = self.snippets.get(vid)
+                if curr_snip is None and self.unchanged_since_load(data):
+                    # Not renamed in this session and not edited: nothing to read or write
+                    msg = f"Skip R{row+1}: No change {vid}."
+                    logging.info(msg)
+                    self.log.emit(msg)
+                    self.row_done(True)
+                    continue
+                if curr_snip is None:
+                    logging.error(f"FAIL R{row+1}: Vid {vid} not found.")
+                    self.log.emit(f"<font color='red'>FAIL R{row+1}: Vid {vid} not found.</font>")
+                    self.row_done(False)
+                    continue
+                curr_t = curr_snip.get('title', '')
+                curr_d = curr_snip.get('description', '')
+                curr_cat = curr_snip.get("categoryId")
+                if not curr_cat:
+                    logging.error(f"FAIL R{row+1}: Vid {vid} no catId.")
+                    self.log.emit(f"<font color='red'>FAIL R{row+1}({vid}): No catId!</font>")
+                    self.row_done(False)
+                    continue
+                t_chg, d_chg = curr_t != new_t, curr_d != new_d
+                if not t_chg and not d_chg:
+                    msg = f"Skip R{row+1}: No change {vid}."
+                    logging.info(msg)
+                    self.log.emit(msg)
+                    self.row_done(True)
+                    continue
+                # videos.update replaces the whole snippet, so the fields we do not change are copied over
+                snip_upd = {"id": vid, "snippet": {"title": new_t, "description": new_d,
+                                                   **{k: curr_snip[k] for k in PRESERVED_SNIPPET_KEYS if k in curr_snip}}}
+                logging.debug("Update body: %s", snip_upd)
+                chgs = [c for c, chgd in [("T", t_chg), ("D", d_chg)] if chgd]
+                chg_s = "&".join(chgs) if chgs else "Meta"
+                updates.append(((row, vid, new_t, new_d, chg_s), snip_upd))
+            except Exception as e:
+                err_msg = f"FAIL R{row+1}({vid}): Err {type(e).__name__}"
+                logging.exception(f"Err upd R{row+1}")
+                self.log.emit(f"<font color='red'>{err_msg}: {e}</font>")
+                self.row_done(False)
+        return updates
+
+    def apply_updates(self, updates):
+        """The updates are independent network calls: run them on a bounded pool, report each result."""
+        with ThreadPoolExecutor(max_workers=RENAME_WORKERS) as executor:
+            futures = {executor.submit(_do_rename, self.videos_resource, self.credentials, body): info
+                       for info, body in updates}
+            for future in as_completed(futures):
+                row, vid, new_t, new_d, chg_s = futures[future]
+                try:
+                    future.result()
+                    # Keep the cached snippet current, so a second run sees this rename
+                    self.snippets[vid].update(title=new_t, description=new_d)
+                    logging.info(f"Upd {vid}")
+                    self.log.emit(f"OK R{row+1}: Upd {chg_s} {vid}:'{new_t[:50]}...'")
+                    self.row_done(True)
+                except HttpError as e:
+                    err_msg = f"FAIL R{row+1}({vid}): API Err {e.resp.status}"
+                    details = _http_error_details(e)
+                    if details:
+                        err_msg += f"-{details}"
+                    logging.exception(f"API Err upd R{row+1}")
+                    self.log.emit(f"<font color='red'>{err_msg}</font>")
+                    self.row_done(False)
+                except Exception as e:
+                    err_msg = f"FAIL R{row+1}({vid}): Err {type(e).__name__}"
+                    logging.exception(f"Err upd R{row+1}")
+                    self.log.emit(f"<font color='red'>{err_msg}: {e}</font>")
+                    self.row_done(False)
+
+class ExcelWorker(QObject):
+    """
+    Generates one Excel file per playlist on a worker thread. The items of
+    several playlists are fetched at once; each playlist is sorted and written
+    as soon as its items arrive. Results are reported through log/progress;
+    the items it fetched are handed back through items_signal so the caller
+    can skip fetching them again.
+    """
+    progress = pyqtSignal(int)
+    log = pyqtSignal(str)
+    items_signal = pyqtSignal(str, int, object)  # playlist_id, itemCount, fetched (see _list_all_pages)
+    finished = pyqtSignal(int, int)  # ok, failed
+
+    def __init__(self, list_method, credentials, playlists, output_dir, cached_items):
+        super().__init__()
+        self.list_method = list_method
+        self.credentials = credentials
+        self.playlists = playlists  # [{id, title, description, count}], copies owned by this worker
+        self.output_dir = output_dir
+        self.cached_items = cached_items  # { playlist_id: fetched } known to be current
+
+    def fetch_items(self, playlist_id):
+        cached = self.cached_items.get(playlist_id)
+        if cached is not None:
+            return cached
+        return _list_all_pages(self.list_method, EXCEL_MAX_PAGES, http=_thread_authorized_http(self.credentials),
+                               part="snippet,contentDetails", playlistId=playlist_id, maxResults=50,
+                               fields=PLAYLIST_ITEMS_FIELDS)
+
+    def run(self):
+        ok_cnt, fail_cnt = 0, 0
+        total = len(self.playlists)
+        # Pages of one playlist must be fetched in order, but several playlists are fetched at once
+        fetcher = ThreadPoolExecutor(max_workers=EXCEL_FETCH_WORKERS)
+        items_futures = {fetcher.submit(self.fetch_items, p['id']): p for p in self.playlists}
+        for i, items_future in enumerate(as_completed(items_futures)):
+            p_data = items_futures[items_future]
+            pid = p_data['id']
+            p_title = p_data.get('title', 'UNKNOWN')
+            p_desc = p_data.get('description', '')
+            self.log.emit(f"\nProc {i+1}/{total}: '{p_title}' (ID: {pid})")
+            try:
+                fetched = items_future.result()
+                self.items_signal.emit(pid, p_data['count'], fetched)
+                self.generate_excel_for_playlist(pid, p_title, p_desc, fetched)
+                self.log.emit(f"--> OK: Gen '{p_title}'.")
+                logging.info(f"OK: Excel {pid} ('{p_title}')")
+                ok_cnt += 1
+            except HttpError as e:
+                fail_cnt += 1
+                err_d = f"{e.resp.status} {e.reason}"
+                details = _http_error_details(e)
+                if details:
+                    err_d += f"-{details}"
+                msg = f"--> FAIL(API) '{p_title}':{err_d}"
+                self.log.emit(f"<font color='red'>{msg}</font>")
+                logging.exception(f"API Err Excel {pid}")
+            except ValueError as e:
+                fail_cnt += 1
+                msg = f"--> FAIL '{p_title}': {e}"
+                self.log.emit(f"<font color='red'>{msg}</font>")
+                logging.error(f"ValErr Excel {pid}: {e}")
+            except Exception as e:
+                fail_cnt += 1
+                msg = f"--> FAIL(Err) '{p_title}':{type(e).__name__}"
+                self.log.emit(f"<font color='red'>{msg}: {e}</font>")
+                logging.exception(f"Err Excel {pid}")
+            finally:
+                self.progress.emit(i + 1)
+        fetcher.shutdown(wait=False)
+        self.finished.emit(ok_cnt, fail_cnt)
+
+    # *** THIS FUNCTION CONTAINS THE SPECIFIC FIX ***
+    def generate_excel_for_playlist(self, playlist_id, playlist_title, playlist_description, fetched):
+        """Sorts the fetched videos (see _list_all_pages), extracts data, and saves to an Excel file."""
+        logging.info(f"Generating Excel for Playlist ID: {playlist_id}, Title: '{playlist_title}'")
+        # 1. Parse Codes
+        course_code, lang_code = "UNKNOWN", "UNKNOWN"
+        match = _PL_CODE_RE.match(playlist_title)
+        if match:
+            course_code, lang_code = match.group(1), match.group(2)
+            logging.info(f"Codes: '{course_code}', '{lang_code}' from '{playlist_title}'")
+        else:
+            logging.warning(f"Title '{playlist_title}' != format.")
+            self.log.emit(f"<font color='orange'>   Warn: Title '{playlist_title}' format mismatch.</font>")
+        # 2. Filename
+        s_desc = sanitize_filename(playlist_description or "NoDesc", True)
+        s_title = sanitize_filename(playlist_title, True)
+        max_l = 80
+        combo = f"{s_desc}_{s_title}"
+        fname = (combo[:max_l] + '...' if len(combo) > max_l else combo) + ".xlsx"
+        fpath = os.path.join(self.output_dir, fname)
+        logging.info(f"Excel path: {fpath}")
+        # 3. Items, fetched ahead by run
+        items = fetched["items"]
+        if fetched["hit_limit"]:
+            logging.warning(f"Max pages excel fetch {playlist_id}.")
+            self.log.emit(f"<font color='orange'>   Warn: Fetched max {EXCEL_MAX_PAGES*50}.</font>")
+        logging.info(f"Fetched {len(items)} total items for playlist {playlist_id}.")
+        self.log.emit(f"   Fetched {len(items)} items.")
+        # 4. One pass over the items: drop unusable ones, stage each row's fields with its sort key, then sort
+        staged = []
+        seen_ids = set()
+        for item in items:
+            snip = item.get("snippet", {})
+            title = snip.get("title")
+            if not title:
+                continue
+            vid = item.get("contentDetails", {}).get("videoId")
+            if not vid:
+                logging.warning(f"Excel: Skip pos {snip.get('position', -1)} ('{title[:50]}...') - no ID.")
+                continue
+            if vid in seen_ids:
+                logging.warning(f"Excel: Skip dup ID {vid} ('{title[:50]}...')")
+                continue
+            seen_ids.add(vid)
+            staged.append((chapter_sort_key(title), title, snip.get("description", ""),
+                           f"https://www.youtube.com/watch?v={vid}"))
+        staged.sort(key=operator.itemgetter(0))
+        logging.info("Excel items sorted.")
+        self.log.emit("   Items sorted.")
+        # 5. Chapter names and order numbers, which depend on the rows before
+        excel_data = []
+        chapter_name = ""
+        order_in_chapter = 0
+        for sort_key, title, desc, url in staged:
+            chapter_excel = ""
+            order_excel = 0
+            # *** CORRECTED LOGIC FOR COURSE INTRODUCTION ***
+            if sort_key[0] == -1:
+                chapter_excel = ""
+                order_excel = 0
+                chapter_name = "Introduction"
+                order_in_chapter = 0
+            elif sort_key[0] == 999:
+                logging.warning(f"Excel: Title '{title}' uses fallback sort.")
+                self.log.emit(f"<font color='orange'>   Warn: Title '{title[:50]}...' not standard format.</font>")
+                chapter_excel = chapter_name if chapter_name and chapter_name != "Introduction" else "Unknown Chapter Content"
+                order_in_chapter += 1
+                order_excel = order_in_chapter
+            else:
+                is_header = sort_key[1] == 0
+                if is_header:
+                    chapter_name = title
+                    chapter_excel = chapter_name
+                    order_excel = 0
+                    order_in_chapter = 0
+                else:
+                    if not chapter_name or chapter_name == "Introduction":
+                        logging.warning(f"Excel: Part '{title}' found before header.")
+                        self.log.emit(f"<font color='orange'>   Warn: Part '{title[:30]}...' before header.</font>")
+                        chapter_excel = "Unknown Chapter"
+                        if chapter_name == "Introduction":
+                            order_in_chapter = 0
+                    else:
+                        chapter_excel = chapter_name
+                    order_in_chapter += 1
+                    order_excel = order_in_chapter
+            # One tuple per row, in EXCEL_COLUMNS order
+            excel_data.append((course_code, chapter_excel, url, title, desc, order_excel, lang_code))
+        # 6. Save
+        if not excel_data:
+            logging.warning(f"No valid data for playlist {playlist_id}. Skipping '{fname}'.")
+            self.log.emit("<font color='orange'>   Warn: No valid video data found.</font>")
+            raise ValueError("No valid video data found to create Excel file.")
+        logging.info(f"Saving {len(excel_data)} rows to {fpath}")
+        self.log.emit(f"   Proc {len(excel_data)} items. Saving: {fname}")
+        try:
+            _write_excel_rows(fpath, excel_data)
+            logging.info(f"Saved: {fpath}")
+        except Exception as e:
+            logging.exception(f"Error saving to Excel: {fpath}")
+            raise IOError(f"Failed to save Excel file {fname}: {e}") from e
+
+# --- Table Model for the Renaming Tab ---
+def build_rename_row(vid_item):
+    """Builds the proposed title/description row for one playlist item."""
+    snip = vid_item.get("snippet", {})
+    cd = vid_item.get("contentDetails", {})
+    vid = cd.get("videoId")
+    orig_t = snip.get("title", "!!! MISSING !!!")
+    pos = snip.get("position", -1)
+    new_t, new_d = orig_t, orig_t
+    m = _RENAME_TITLE_RE.match(orig_t)
+    if m and m.group('ch'):
+        ch = m.group('ch').strip()
+        tpc = m.group('topic').strip()
+        new_t = f"{ch} - {tpc}" if tpc else ch
+        new_d = tpc if tpc else orig_t
+    return {"orig_title": orig_t, "orig_desc": snip.get("description", ""),
+            "new_title": new_t, "new_desc": new_d, "vid": vid, "pos": pos}
+
+class RenameRowsModel(QAbstractTableModel):
+    """
+    Serves the rename scheme straight from a list of row dicts
+    ({orig_title, orig_desc, new_title, new_desc, vid, pos}) instead of three
+    QTableWidgetItems per video. The proposed title/desc columns are editable.
+    Rows are built from the raw playlist items in FETCH_BATCH chunks as the
+    view scrolls to them (canFetchMore/fetchMore).
+    The videos' current snippets, fetched once after loading, are kept by video
+    ID so renaming does not have to read them again (Qt.UserRole + 2).
+    """
+    HEADERS = ("Original Title", "Proposed Title", "Proposed Desc")
+    COLUMN_KEYS = ("orig_title", "new_title", "new_desc")
+    FETCH_BATCH = 100
+    # Views query many roles per cell (font, colors, alignment...); all others return None at once
+    _DATA_ROLES = frozenset({Qt.DisplayRole, Qt.EditRole, Qt.UserRole, Qt.UserRole + 1, Qt.UserRole + 2,
+                             Qt.ToolTipRole})
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items = []  # Sorted playlist items from the API
+        self._rows = []   # Rows built so far, always a prefix of _items
+        self._snippets = {}  # { video_id: current snippet }
+
+    def set_items(self, items):
+        """Replaces the playlist items with a single model reset; rows are built on demand."""
+        self.beginResetModel()
+        self._items = items
+        self._rows = []
+        self._snippets = {}
+        self.endResetModel()
+
+    def item_count(self):
+        return len(self._items)
+
+    def video_ids(self):
+        """Returns the distinct video IDs of all items, in playlist order."""
+        vids = (item.get("contentDetails", {}).get("videoId") for item in self._items)
+        return list(dict.fromkeys(vid for vid in vids if vid))
+
+    def snippet(self, vid):
+        return self._snippets.get(vid)
+
+    def add_snippets(self, snippets):
+        """Caches fetched snippets; entries already cached (possibly updated by a rename) are kept."""
+        for vid, snip in snippets.items():
+            self._snippets.setdefault(vid, snip)
+
+    def update_snippets(self, snippets):
+        """Caches snippets that are known to be current, replacing older entries."""
+        self._snippets.update(snippets)
+
+    def all_rows(self):
+        """Returns every row, building the ones the view has not fetched yet."""
+        while self.canFetchMore(QModelIndex()):
+            self.fetchMore(QModelIndex())
+        return self._rows
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self._rows) < len(self._items)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        start = len(self._rows)
+        count = min(self.FETCH_BATCH, len(self._items) - start)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), start, start + count - 1)
+        self._rows.extend(build_rename_row(item) for item in self._items[start:start + count])
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMN_KEYS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role not in self._DATA_ROLES or not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        col = index.column()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return row[self.COLUMN_KEYS[col]]
+        if col == 0:
+            if role == Qt.UserRole:
+                return row["vid"]
+            if role == Qt.UserRole + 1:
+                return row["pos"]
+            if role == Qt.UserRole + 2:
+                return self._snippets.get(row["vid"])
+            if role == Qt.ToolTipRole:
+                return f"ID: {row['vid']}\nPos: {row['pos']}"
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not index.isValid() or index.column() == 0:
+            return False
+        self._rows[index.row()][self.COLUMN_KEYS[index.column()]] = value
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        if index.column() > 0:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return section + 1
+
+# --- Table Model for the Checking Tab ---
+class CheckTableModel(QAbstractTableModel):
+    """
+    Shows the folder filenames and the playlist titles side by side, straight
+    from the two name lists; rows past the end of a list are blank. Names can
+    be edited in place, and rows flagged by the last comparison are tinted.
+    """
+    HEADERS = ("#", "Folder Filename", "YouTube Title")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names = {1: [], 2: []}  # Column -> list of names, shared with the caller
+        self._mismatch_rows = frozenset()
+
+    def set_names(self, col, names):
+        """Replaces one column's names with a single model reset; clears the comparison tint."""
+        self.beginResetModel()
+        self._names[col] = names
+        self._mismatch_rows = frozenset()
+        self.endResetModel()
+
+    def names(self, col):
+        return self._names[col]
+
+    def set_mismatch_rows(self, rows):
+        self._mismatch_rows = frozenset(rows)
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0, 1), self.index(self.rowCount() - 1, 2), [Qt.BackgroundRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else max(len(self._names[1]), len(self._names[2]))
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if col == 0:
+                return str(row + 1)
+            names = self._names[col]
+            return names[row] if row < len(names) else ""
+        if role == Qt.TextAlignmentRole and col == 0:
+            return Qt.AlignCenter
+        if role == Qt.BackgroundRole and col > 0 and row in self._mismatch_rows:
+            return _BRUSH_MISMATCH
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not (self.flags(index) & Qt.ItemIsEditable):
+            return False
+        self._names[index.column()][index.row()] = value
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        col = index.column()
+        if col > 0 and index.row() < len(self._names[col]):
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return section + 1
+
+# --- Table Model for the Excel Tab ---
+class ExcelPlaylistsModel(QAbstractTableModel):
+    """
+    Lists the channel's playlists straight from their dicts ({id, title,
+    description, count}): a check box in column 0 (Qt.CheckStateRole) instead
+    of a QCheckBox cell widget per row, and the details in column 1.
+    """
+    HEADERS = ("Select", "Playlist Details")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._playlists = []
+        self._checked = []
+
+    def set_playlists(self, playlists):
+        """Replaces the playlists with a single model reset; all rows start unchecked."""
+        self.beginResetModel()
+        self._playlists = playlists
+        self._checked = [False] * len(playlists)
+        self.endResetModel()
+
+    def checked_playlists(self):
+        return [p for p, checked in zip(self._playlists, self._checked) if checked]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._playlists)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if col == 0:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if self._checked[row] else Qt.Unchecked
+            return None
+        p = self._playlists[row]
+        if role == Qt.DisplayRole:
+            desc = p['description']
+            desc_prev = desc[:100].replace('\n', ' ') + ('...' if len(desc) > 100 else '')
+            return f"{p['title']}\nDesc:{desc_prev}\n({p['count']} videos)"
+        if role == Qt.ToolTipRole:
+            return f"ID:{p['id']}\nTitle:{p['title']}\nVideos:{p['count']}\nDesc:{p['description']}"
+        if role == Qt.UserRole:
+            return p['id']
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid() or index.column() != 0:
+            return False
+        self._checked[index.row()] = value == Qt.Checked
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        if index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return section + 1
+
 # --- Main Application Window ---
 class MainWindow(QMainWindow):
     # Class variable to store the absolute path to the tokens directory
     _tokens_dir_abs = os.path.abspath(TOKENS_DIR)
+    _dirs_ready = False  # Set once the tokens directory is known to exist
 
     @classmethod
     def get_tokens_dir_abs(cls):
@@ -165,20 +1126,47 @@ class MainWindow(QMainWindow):
 
         # Channel Profile Management
         self.channel_profiles = {}  # { 'dict_key': { 'name': display_name, 'api_key': ..., ... } }
+        self._row_by_key = {}  # { 'dict_key': row in channel_table }, rebuilt by populate_channel_table
+        # Column-wise copies of the profiles in table order, see rebuild_profile_columns
+        self._profile_keys, self._profile_names, self._profile_has_api_key = [], [], []
+        self._profile_secret_paths, self._profile_token_paths = [], []
+        self._key_by_token_path = {}  # { token_path: 'dict_key' }, rebuilt with the column lists
+        self._creds_cache = {}  # { token_path: (st_mtime_ns, Credentials) }, kept out of the saved profiles
         self.config_file = CONFIG_FILE
+        self._config_mtime_ns = None  # mtime of the config as last loaded/saved
         self.tokens_dir = self.get_tokens_dir_abs()
 
         # Dictionaries for other tabs
         self.rename_playlists = {}  # { display_text: playlist_id }
         self.check_playlists = {}   # { display_text: playlist_id }
         self.excel_playlists_data = {}  # { playlist_id: { 'id': ..., 'title': ..., ... } }
+        self._loading_excel_playlists = False  # Single-flight guards of the Excel tab's two buttons
+        self._generating_excels = False
+        self._rename_list_worker = None   # PagedListWorker loading the rename playlists
+        self._rename_items_worker = None  # PagedListWorker loading the rename scheme videos
+        self._rename_scheme_pid = None  # Playlist whose videos the rename model holds
+        self._rename_thread, self._rename_worker = None, None  # RenameWorker applying the scheme
+        self._excel_thread, self._excel_worker = None, None  # ExcelWorker writing the selected playlists
+        self._excel_items_cache = {}  # { playlist_id: (itemCount, fetched) } from earlier exports this session
+        self._rename_log_buffer = []  # Rename log lines not yet shown, see buffer_rename_log
+        self._background_tasks = set()  # (QThread, TaskWorker) pairs of run_background_task
         self.folder_files = []      # List of folder basenames for checking tab
         self.playlist_titles = []   # List of playlist titles for checking tab
 
+        # Debounced config writes, see schedule_save_channel_config
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self.save_channel_config)
+
         self.setup_logging()  # Call logging setup first
         self.ensure_dirs()    # Ensure directories exist
         self.load_channel_config()  # Load profiles after ensuring dirs
 
+        # Push token status changes to the table as token files appear or disappear
+        self._known_token_names = self.get_token_file_names()
+        self._tokens_watcher = QFileSystemWatcher([self.tokens_dir], self)
+        self._tokens_watcher.directoryChanged.connect(self.on_tokens_dir_changed)
+
         # Setup UI Tabs
         self.tabs = QTabWidget()
         self.setCentralWidget(self.tabs)
@@ -200,22 +1188,28 @@ class MainWindow(QMainWindow):
         self.init_excel_tab()
 
     def setup_logging(self):
-        """Sets up logging to file and console, includes library versions."""
+        """
+        Sets up logging to file and console, includes library versions.
+        Records are queued; a listener thread does the file/console writes,
+        so logging from the GUI thread never waits on I/O.
+        """
         log_format = '%(asctime)s - %(levelname)s - [%(funcName)s:%(lineno)d] - %(message)s'
         log_file = 'youtube_manager.log'
         try:
-            logging.basicConfig(
-                filename=log_file,
-                level=logging.INFO,  # Use INFO, change to DEBUG for troubleshooting
-                format=log_format,
-                filemode='w',  # Overwrite log each time
-                encoding='utf-8'
-            )
-            # Add console handler
+            formatter = logging.Formatter(log_format)
+            file_handler = logging.FileHandler(log_file, mode='w', encoding='utf-8')  # Overwrite log each time
+            file_handler.setFormatter(formatter)
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(logging.INFO)
-            console_handler.setFormatter(logging.Formatter(log_format))
-            logging.getLogger().addHandler(console_handler)
+            console_handler.setFormatter(formatter)
+            log_queue = queue.SimpleQueue()
+            root_logger = logging.getLogger()
+            root_logger.setLevel(logging.INFO)  # Use INFO, change to DEBUG for troubleshooting
+            root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler,
+                                                      respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)  # Writes out whatever is still queued
 
             logging.info("-" * 30)
             logging.info("Application started.")
@@ -223,31 +1217,34 @@ class MainWindow(QMainWindow):
             logging.info(f"Python Version: {sys.version}")
             logging.info(f"Platform: {sys.platform}")
 
-            libs_to_check = {
-                "google-auth": "google.auth",
-                "google-auth-oauthlib": "google_auth_oauthlib",
-                "google-api-python-client": "googleapiclient",
-                "pandas": "pandas",
-                "openpyxl": "openpyxl",
-                "PyQt5": "PyQt5"
-            }
-            versions_found = []
-            for lib_name, import_name in libs_to_check.items():
-                try:
-                    version = importlib.metadata.version(lib_name)
-                    versions_found.append(f"{lib_name}=={version}")
-                except importlib.metadata.PackageNotFoundError:
-                    if import_name == "googleapiclient":
-                        try:
-                            import googleapiclient
-                            versions_found.append(f"{lib_name}=={googleapiclient.__version__}")
-                        except (ImportError, AttributeError):
-                            logging.warning(f"Could not determine version for {lib_name}")
-                    else:
-                        logging.warning(f"Could not determine version for {lib_name} (Package not found)")
-                except Exception as e:
-                    logging.warning(f"Error getting version for {lib_name}: {e}")
-            logging.debug(f"Library versions: {', '.join(versions_found)}")
+            # Only logged at DEBUG, skip the metadata lookups otherwise
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                libs_to_check = {
+                    "google-auth": "google.auth",
+                    "google-auth-oauthlib": "google_auth_oauthlib",
+                    "google-api-python-client": "googleapiclient",
+                    "openpyxl": "openpyxl",
+                    "XlsxWriter": "xlsxwriter",
+                    "PyExcelerate": "pyexcelerate",
+                    "PyQt5": "PyQt5"
+                }
+                versions_found = []
+                for lib_name, import_name in libs_to_check.items():
+                    try:
+                        version = importlib.metadata.version(lib_name)
+                        versions_found.append(f"{lib_name}=={version}")
+                    except importlib.metadata.PackageNotFoundError:
+                        if import_name == "googleapiclient":
+                            try:
+                                import googleapiclient
+                                versions_found.append(f"{lib_name}=={googleapiclient.__version__}")
+                            except (ImportError, AttributeError):
+                                logging.warning(f"Could not determine version for {lib_name}")
+                        else:
+                            logging.warning(f"Could not determine version for {lib_name} (Package not found)")
+                    except Exception as e:
+                        logging.warning(f"Error getting version for {lib_name}: {e}")
+                logging.debug("Library versions: %s", ", ".join(versions_found))
             logging.info("-" * 30)
 
         except Exception as e:
@@ -255,8 +1252,11 @@ class MainWindow(QMainWindow):
 
     def ensure_dirs(self):
         """Ensures the tokens directory exists."""
+        if MainWindow._dirs_ready:
+            return
         try:
             os.makedirs(self.tokens_dir, exist_ok=True)
+            MainWindow._dirs_ready = True
             logging.info(f"Ensured tokens directory exists: {self.tokens_dir}")
         except OSError as e:
             logging.error(f"Could not create tokens directory '{self.tokens_dir}': {e}", exc_info=True)
@@ -268,8 +1268,14 @@ class MainWindow(QMainWindow):
         """Loads channel profiles from the JSON config file."""
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.channel_profiles = json.load(f)
+                st = os.stat(self.config_file)
+                if st.st_mtime_ns == self._config_mtime_ns:
+                    logging.debug("%s unchanged since last load, skipping reload", self.config_file)
+                    return
+                with open(self.config_file, 'rb') as f:
+                    raw = f.read()
+                self.channel_profiles = orjson.loads(raw) if orjson else json.loads(raw)
+                self._config_mtime_ns = st.st_mtime_ns
                 logging.info(f"Loaded {len(self.channel_profiles)} channel profiles from {self.config_file}")
             except json.JSONDecodeError:
                 logging.error(f"Error decoding JSON from {self.config_file}. Backing up and starting fresh.", exc_info=True)
@@ -291,17 +1297,16 @@ class MainWindow(QMainWindow):
             self.channel_profiles = {}
 
         keys_to_remove = []
+        token_prefix = self.tokens_dir + os.sep  # tokens_dir is absolute, plain concatenation matches os.path.join
         for key, profile in self.channel_profiles.items():
-            required_keys = ['name', 'api_key', 'client_secret_path', 'token_path']
-            if not all(k in profile for k in required_keys):
+            if not all(k in profile for k in REQUIRED_PROFILE_KEYS):
                 logging.warning(f"Profile '{key}' missing required keys. Marking for removal.")
                 keys_to_remove.append(key)
                 continue
             try:
                 stored_name = profile.get('name', key)
                 sanitized_name = sanitize_filename(stored_name)
-                correct_token_filename = f"{sanitized_name}_token.json"
-                correct_token_path = os.path.join(self.tokens_dir, correct_token_filename)
+                correct_token_path = f"{token_prefix}{sanitized_name}_token.json"
                 if profile.get('token_path') != correct_token_path:
                     logging.warning(f"Profile '{key}' token path corrected: '{profile.get('token_path')}' -> '{correct_token_path}'")
                     profile['token_path'] = correct_token_path
@@ -319,12 +1324,29 @@ class MainWindow(QMainWindow):
                 del self.channel_profiles[key]
             self.save_channel_config()
 
+    def schedule_save_channel_config(self):
+        """Saves the profiles after CONFIG_SAVE_DELAY_MS, coalescing rapid successive changes."""
+        self._save_timer.start(CONFIG_SAVE_DELAY_MS)
+
+    def flush_channel_config(self):
+        """Writes a pending debounced save immediately."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.save_channel_config()
+
+    def closeEvent(self, event):
+        self.flush_channel_config()
+        super().closeEvent(event)
+
     def save_channel_config(self):
         """Saves the current channel profiles to the JSON config file."""
+        self._save_timer.stop()
         try:
             sorted_profiles = dict(sorted(self.channel_profiles.items(), key=lambda item: item[1].get('name', item[0])))
+            # Always the json module, so the file's format does not depend on orjson being installed
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(sorted_profiles, f, indent=4, ensure_ascii=False)
+            self._config_mtime_ns = os.stat(self.config_file).st_mtime_ns
             logging.info(f"Saved {len(sorted_profiles)} channel profiles to {self.config_file}")
         except Exception as e:
             logging.error(f"Failed save profiles to {self.config_file}: {e}", exc_info=True)
@@ -384,43 +1406,94 @@ class MainWindow(QMainWindow):
         self.auth_tab.setLayout(layout)
         self.populate_channel_table()
 
+    def get_token_file_names(self):
+        """Returns the names of the files in the tokens directory, read with a single scandir."""
+        try:
+            with os.scandir(self.tokens_dir) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except OSError as e:
+            logging.warning(f"Could not list tokens directory '{self.tokens_dir}': {e}")
+            return set()
+
+    def rebuild_profile_columns(self):
+        """
+        Rebuilds the parallel per-column lists of the profiles, sorted by display name.
+        channel_profiles stays the canonical store for key lookups; these lists are
+        only for walking all profiles in table order.
+        """
+        sorted_items = sorted(self.channel_profiles.items(), key=lambda item: item[1].get('name', item[0]))
+        self._profile_keys = [key for key, _ in sorted_items]
+        self._profile_names = [profile.get('name', key) for key, profile in sorted_items]
+        self._profile_has_api_key = [bool(profile.get('api_key')) for _, profile in sorted_items]
+        self._profile_secret_paths = [profile.get('client_secret_path', 'N/A') for _, profile in sorted_items]
+        self._profile_token_paths = [profile.get('token_path', 'N/A') for _, profile in sorted_items]
+        self._key_by_token_path = dict(zip(self._profile_token_paths, self._profile_keys))
+
     def populate_channel_table(self):
         """Fills the channel table with data from self.channel_profiles."""
         self.channel_table.setRowCount(0)
+        self._row_by_key = {}
+        self.rebuild_profile_columns()
         if not self.channel_profiles:
             logging.info("No profiles to show.")
             return
-        sorted_items = sorted(self.channel_profiles.items(), key=lambda item: item[1].get('name', item[0]))
-        self.channel_table.setRowCount(len(sorted_items))
-        for row, (key, profile) in enumerate(sorted_items):
-            display_name = profile.get('name', key)
-            name_item = QTableWidgetItem(display_name)
-            name_item.setData(Qt.UserRole, key)
-            api_key_item = QTableWidgetItem("Yes" if profile.get('api_key') else "No")
-            api_key_item.setTextAlignment(Qt.AlignCenter)
-            cs_path = profile.get('client_secret_path', 'N/A')
-            cs_item = QTableWidgetItem(os.path.basename(cs_path))
-            cs_item.setToolTip(cs_path)
-            token_path = profile.get('token_path', 'N/A')
-            tk_item = QTableWidgetItem(os.path.basename(token_path))
-            tk_item.setToolTip(token_path)
-            status_txt, status_clr = "Needs Auth", QColor("black")
-            if os.path.exists(token_path):
-                status_txt, status_clr = "Token Exists", QColor("darkGray")
-            if self.current_channel_profile and self.current_channel_profile.get('token_path') == token_path:
-                status_txt, status_clr = "Authenticated", QColor("green")
-            status_item = QTableWidgetItem(status_txt)
-            status_item.setForeground(status_clr)
-            self.channel_table.setItem(row, 0, name_item)
-            self.channel_table.setItem(row, 1, api_key_item)
-            self.channel_table.setItem(row, 2, cs_item)
-            self.channel_table.setItem(row, 3, tk_item)
-            self.channel_table.setItem(row, 4, status_item)
+        token_names = self.get_token_file_names()
+        # One layout pass and repaint for the whole table instead of one per cell: the
+        # ResizeToContents columns are sized once at the end, no sorting or signals meanwhile
+        header = self.channel_table.horizontalHeader()
+        sorting_was_enabled = self.channel_table.isSortingEnabled()
+        self.channel_table.setUpdatesEnabled(False)
+        self.channel_table.setSortingEnabled(False)
+        self.channel_table.blockSignals(True)
+        for col in range(1, 5):
+            header.setSectionResizeMode(col, QHeaderView.Interactive)
+        try:
+            self.channel_table.setRowCount(len(self._profile_keys))
+            columns = zip(self._profile_keys, self._profile_names, self._profile_has_api_key,
+                          self._profile_secret_paths, self._profile_token_paths)
+            for row, (key, display_name, has_api_key, cs_path, token_path) in enumerate(columns):
+                self.set_channel_row(row, key, display_name, has_api_key, cs_path, token_path, token_names)
+        finally:
+            for col in range(1, 5):
+                header.setSectionResizeMode(col, QHeaderView.ResizeToContents)
+            self.channel_table.blockSignals(False)
+            self.channel_table.setSortingEnabled(sorting_was_enabled)
+            self.channel_table.setUpdatesEnabled(True)
         self.channel_table.resizeColumnsToContents()
         self.channel_table.resizeRowsToContents()
         if self.channel_table.rowCount() > 0:
             self.channel_table.selectRow(0)
 
+    def set_channel_row(self, row, key, display_name, has_api_key, cs_path, token_path, token_names):
+        """Writes one profile's cells into an existing table row and records its row index."""
+        name_item = QTableWidgetItem(display_name)
+        name_item.setData(Qt.UserRole, key)
+        api_key_item = QTableWidgetItem("Yes" if has_api_key else "No")
+        api_key_item.setTextAlignment(Qt.AlignCenter)
+        cs_item = QTableWidgetItem(os.path.basename(cs_path))
+        cs_item.setToolTip(cs_path)
+        tk_item = QTableWidgetItem(os.path.basename(token_path))
+        tk_item.setToolTip(token_path)
+        status_txt, status_clr = "Needs Auth", _COL_BLACK
+        if os.path.basename(token_path) in token_names:
+            status_txt, status_clr = "Token Exists", _COL_DARKGRAY
+        if self.current_channel_profile and self.current_channel_profile.get('token_path') == token_path:
+            status_txt, status_clr = "Authenticated", _COL_GREEN
+        status_item = QTableWidgetItem(status_txt)
+        status_item.setForeground(status_clr)
+        self.channel_table.setItem(row, 0, name_item)
+        self.channel_table.setItem(row, 1, api_key_item)
+        self.channel_table.setItem(row, 2, cs_item)
+        self.channel_table.setItem(row, 3, tk_item)
+        self.channel_table.setItem(row, 4, status_item)
+        self._row_by_key[key] = row
+
+    def update_channel_row(self, row, key, profile):
+        """Refreshes a single row in place after a profile was added or edited."""
+        self.set_channel_row(row, key, profile.get('name', key), bool(profile.get('api_key')),
+                             profile.get('client_secret_path', 'N/A'), profile.get('token_path', 'N/A'),
+                             self.get_token_file_names())
+
     def add_channel(self):
         """Opens the dialog to add a new channel profile."""
         dialog = ChannelDialog(self)
@@ -431,14 +1504,13 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Duplicate Name", f"Profile '{channel_key}' already exists.")
                 return
             self.channel_profiles[channel_key] = new_data
-            self.save_channel_config()
-            self.populate_channel_table()
+            self.schedule_save_channel_config()
+            self.rebuild_profile_columns()
+            row = self.channel_table.rowCount()
+            self.channel_table.insertRow(row)
+            self.update_channel_row(row, channel_key, new_data)
             logging.info(f"Added profile: '{channel_key}'")
-            for row in range(self.channel_table.rowCount()):
-                item = self.channel_table.item(row, 0)
-                if item and item.data(Qt.UserRole) == channel_key:
-                    self.channel_table.selectRow(row)
-                    break
+            self.channel_table.selectRow(row)
 
     def edit_channel(self):
         """Opens the dialog to edit the selected channel profile."""
@@ -475,14 +1547,12 @@ class MainWindow(QMainWindow):
                         logging.error(f"Rename token failed {old_token}: {e}")
                         QMessageBox.warning(self, "File Warning", "Rename token failed.")
             self.channel_profiles[new_key] = updated_data
-            self.save_channel_config()
-            self.populate_channel_table()
+            self.schedule_save_channel_config()
+            self.rebuild_profile_columns()
+            self._row_by_key.pop(orig_key, None)
+            self.update_channel_row(sel_row, new_key, updated_data)
             logging.info(f"Updated profile: '{new_key}'")
-            for row in range(self.channel_table.rowCount()):
-                item = self.channel_table.item(row, 0)
-                if item and item.data(Qt.UserRole) == new_key:
-                    self.channel_table.selectRow(row)
-                    break
+            self.channel_table.selectRow(sel_row)
 
     def remove_channel(self):
         """Removes the selected channel profile."""
@@ -512,27 +1582,29 @@ class MainWindow(QMainWindow):
                 except OSError as e:
                     logging.error(f"Remove token failed '{token_remove}': {e}", exc_info=True)
                     QMessageBox.warning(self, "File Error", f"Delete token failed:\n{token_remove}\n{e}")
-            self.save_channel_config()
-            self.populate_channel_table()
+            self.schedule_save_channel_config()
+            self.rebuild_profile_columns()
+            self.channel_table.removeRow(sel_row)
+            self._row_by_key.pop(key_remove, None)
+            for key, row in self._row_by_key.items():
+                if row > sel_row:
+                    self._row_by_key[key] = row - 1
             logging.info(f"Removed profile: '{disp_name}' (key: '{key_remove}')")
             if self.current_channel_profile and self.current_channel_profile.get('name') == disp_name:
                 self.reset_authentication_state()
                 self.auth_status_label.setText("Status: Select & Authenticate.")
                 self.auth_status_label.setStyleSheet("font-weight:bold;color:black;")
 
-    def update_channel_status(self, channel_key, status_text, color=QColor("black")):
+    def update_channel_status(self, channel_key, status_text, color=_COL_BLACK):
         """Updates the status column in the table for a specific channel key."""
-        for row in range(self.channel_table.rowCount()):
-            item = self.channel_table.item(row, 0)
-            if item and item.data(Qt.UserRole) == channel_key:
-                status_item = self.channel_table.item(row, 4)
-                if not status_item:
-                    status_item = QTableWidgetItem()
-                    self.channel_table.setItem(row, 4, status_item)
-                status_item.setText(status_text)
-                status_item.setForeground(color)
-                break
-        QApplication.processEvents()
+        row = self._row_by_key.get(channel_key)
+        if row is not None:
+            status_item = self.channel_table.item(row, 4)
+            if not status_item:
+                status_item = QTableWidgetItem()
+                self.channel_table.setItem(row, 4, status_item)
+            status_item.setText(status_text)
+            status_item.setForeground(color)
 
     def authenticate_selected_channel(self):
         """Authenticates using the profile selected in the table."""
@@ -547,7 +1619,7 @@ class MainWindow(QMainWindow):
         if channel_key not in self.channel_profiles:
             QMessageBox.critical(self, "Error", f"Profile data missing '{channel_key}'.")
             logging.error(f"Auth mismatch: '{channel_key}'.")
-            self.update_channel_status(channel_key, "Config Error", QColor("red"))
+            self.update_channel_status(channel_key, "Config Error", _COL_RED)
             return
         profile = self.channel_profiles[channel_key]
         disp_name = profile.get('name', channel_key)
@@ -555,43 +1627,43 @@ class MainWindow(QMainWindow):
         if not cs_file or not tk_file:
             QMessageBox.critical(self, "Config Error", f"Profile '{disp_name}' lacks paths.")
             logging.error(f"Paths missing for {disp_name}")
-            self.update_channel_status(channel_key, "Config Error", QColor("red"))
+            self.update_channel_status(channel_key, "Config Error", _COL_RED)
             return
         if not os.path.exists(cs_file):
             QMessageBox.critical(self, "File Error", f"Secret file missing for '{disp_name}':\n{cs_file}")
             logging.error(f"Secret missing: {cs_file}")
-            self.update_channel_status(channel_key, "Secret Missing", QColor("red"))
+            self.update_channel_status(channel_key, "Secret Missing", _COL_RED)
             return
 
         logging.info(f"Auth attempt: '{disp_name}'")
         self.auth_status_label.setText(f"Status: Authenticating '{disp_name}'...")
         self.auth_status_label.setStyleSheet("font-weight:bold;color:orange;")
-        self.update_channel_status(channel_key, "Authenticating...", QColor("orange"))
+        self.update_channel_status(channel_key, "Authenticating...", _COL_ORANGE)
         QApplication.processEvents()
         creds = None
         try:
-            if os.path.exists(tk_file):
-                logging.info(f"Loading token: {tk_file}")
+            if os.path.basename(tk_file) in self.get_token_file_names():
                 try:
-                    creds = Credentials.from_authorized_user_file(tk_file, SCOPES)
-                    logging.debug("Token loaded.")
+                    creds = self.load_token_credentials(tk_file)
                 except Exception as e:
                     logging.warning(f"Load token failed {tk_file}: {e}", exc_info=True)
                     creds = None
             if not creds or not creds.valid:
                 if creds and creds.expired and creds.refresh_token:
                     logging.info(f"Refreshing: '{disp_name}'.")
-                    self.update_channel_status(channel_key, "Refreshing...", QColor("orange"))
+                    self._creds_cache.pop(tk_file, None)
+                    self.update_channel_status(channel_key, "Refreshing...", _COL_ORANGE)
                     QApplication.processEvents()
                     try:
+                        from google.auth.transport.requests import Request
                         creds.refresh(Request())
                         logging.info(f"Refreshed: '{disp_name}'.")
                     except Exception as e:
                         logging.warning(f"Refresh failed '{disp_name}': {e}. Need re-auth.", exc_info=True)
                         creds = None
                     if creds:
-                        with open(tk_file, 'w', encoding='utf-8') as token:
-                            token.write(creds.to_json())
+                        _atomic_write_token(tk_file, creds)
+                        self.cache_token_credentials(tk_file, creds)
                         logging.info(f"Saved refreshed: {tk_file}")
                     elif os.path.exists(tk_file):
                         try:
@@ -601,41 +1673,40 @@ class MainWindow(QMainWindow):
                             pass
                 if not creds or not creds.valid:
                     logging.info(f"OAuth flow needed for '{disp_name}'.")
-                    self.update_channel_status(channel_key, "User Auth Required", QColor("blue"))
+                    self.update_channel_status(channel_key, "User Auth Required", _COL_BLUE)
                     QApplication.processEvents()
                     QMessageBox.information(self, "Authentication Required",
                                             f"Authorize access for: '{disp_name}'.\nBrowser will open.", QMessageBox.Ok)
-                    flow = ForceAccountSelectionFlow.from_client_secrets_file(cs_file, SCOPES)
-                    creds = flow.run_local_server(port=0)
+                    flow = force_account_selection_flow().from_client_secrets_file(cs_file, SCOPES)
+                    creds = self.run_oauth_flow(flow)
                     logging.info(f"OAuth done for '{disp_name}'.")
-                    with open(tk_file, 'w', encoding='utf-8') as token:
-                        token.write(creds.to_json())
+                    _atomic_write_token(tk_file, creds)
+                    self.cache_token_credentials(tk_file, creds)
                     logging.info(f"New token saved: {tk_file}")
 
             self.credentials = creds
             build_args = {'credentials': creds}
             if api_key:
                 build_args['developerKey'] = api_key
+            from googleapiclient.discovery import build
             self.youtube = build('youtube', 'v3', **build_args)
             logging.info(f"Service built for '{disp_name}'.")
             self.current_channel_profile = profile
             self.auth_status_label.setText(f"Status: Authenticated as '{disp_name}'")
             self.auth_status_label.setStyleSheet("font-weight:bold;color:green;")
-            self.update_channel_status(channel_key, "Authenticated", QColor("green"))
+            self.update_channel_status(channel_key, "Authenticated", _COL_GREEN)
             self.update_inactive_channel_statuses(channel_key)
             QMessageBox.information(self, "Success", f"Authenticated as:\n'{disp_name}'!")
         except HttpError as e:
             error_d = f"API Error: {e.resp.status} {e.reason}"
-            try:
-                c = json.loads(e.content)
-                error_d += f"\n{c.get('error', {}).get('message', '')}"
-            except Exception:
-                pass
+            details = _http_error_details(e)
+            if details:
+                error_d += f"\n{details}"
             QMessageBox.critical(self, "API Error", f"Auth failed '{disp_name}':\n{error_d}")
             logging.error(f"Auth HttpError {disp_name}: {e}", exc_info=True)
             self.auth_status_label.setText("Status: Auth Failed (API)")
             self.auth_status_label.setStyleSheet("font-weight:bold;color:red;")
-            self.update_channel_status(channel_key, f"API Error ({e.resp.status})", QColor("red"))
+            self.update_channel_status(channel_key, f"API Error ({e.resp.status})", _COL_RED)
             self.reset_authentication_state()
         except Exception as e:
             error_t = type(e).__name__
@@ -643,18 +1714,93 @@ class MainWindow(QMainWindow):
             logging.exception(f"Auth Exception {disp_name}.")
             self.auth_status_label.setText(f"Status: Auth Failed ({error_t})")
             self.auth_status_label.setStyleSheet("font-weight:bold;color:red;")
-            self.update_channel_status(channel_key, f"Auth Error ({error_t})", QColor("red"))
+            self.update_channel_status(channel_key, f"Auth Error ({error_t})", _COL_RED)
             self.reset_authentication_state()
 
+    def run_oauth_flow(self, flow):
+        """
+        Runs the browser OAuth flow on a worker thread and waits for it in a local
+        event loop, so the window keeps repainting while the user is in the browser.
+        """
+        thread = QThread(self)
+        worker = OAuthWorker(flow)
+        worker.moveToThread(thread)
+        result = {}
+        loop = QEventLoop()
+
+        def on_finished(creds, error):
+            result['creds'], result['error'] = creds, error
+            loop.quit()
+
+        worker.finished.connect(on_finished)
+        thread.started.connect(worker.run)
+        self.authenticate_btn.setEnabled(False)  # No second flow while this one is pending
+        try:
+            thread.start()
+            loop.exec_()
+        finally:
+            thread.quit()
+            thread.wait()
+            self.authenticate_btn.setEnabled(True)
+        if result['error'] is not None:
+            raise result['error']
+        return result['creds']
+
+    def load_token_credentials(self, tk_file):
+        """Loads a token file, reusing the parsed credentials while the file's mtime is unchanged."""
+        mtime_ns = os.stat(tk_file).st_mtime_ns
+        cached = self._creds_cache.get(tk_file)
+        if cached and cached[0] == mtime_ns:
+            logging.debug("Token reused from cache: %s", tk_file)
+            return cached[1]
+        logging.info(f"Loading token: {tk_file}")
+        from google.oauth2.credentials import Credentials
+        creds = Credentials.from_authorized_user_file(tk_file, SCOPES)
+        logging.debug("Token loaded.")
+        self._creds_cache[tk_file] = (mtime_ns, creds)
+        return creds
+
+    def cache_token_credentials(self, tk_file, creds):
+        """Remembers credentials just written to tk_file, keyed on the new mtime."""
+        try:
+            self._creds_cache[tk_file] = (os.stat(tk_file).st_mtime_ns, creds)
+        except OSError:
+            self._creds_cache.pop(tk_file, None)
+
     def update_inactive_channel_statuses(self, active_channel_key):
         """Sets status for all channels not currently active."""
-        for key, profile in self.channel_profiles.items():
-            if key != active_channel_key:
-                tk_path = profile.get('token_path')
-                if tk_path and os.path.exists(tk_path):
-                    self.update_channel_status(key, "Token Exists", QColor("darkGray"))
-                else:
-                    self.update_channel_status(key, "Needs Auth", QColor("black"))
+        # Repaint once after all rows are updated instead of once per row
+        token_names = self.get_token_file_names()
+        sorting_was_enabled = self.channel_table.isSortingEnabled()
+        self.channel_table.setUpdatesEnabled(False)
+        self.channel_table.setSortingEnabled(False)
+        try:
+            for key, profile in self.channel_profiles.items():
+                if key != active_channel_key:
+                    tk_path = profile.get('token_path')
+                    if tk_path and os.path.basename(tk_path) in token_names:
+                        self.update_channel_status(key, "Token Exists", _COL_DARKGRAY)
+                    else:
+                        self.update_channel_status(key, "Needs Auth", _COL_BLACK)
+        finally:
+            self.channel_table.setSortingEnabled(sorting_was_enabled)
+            self.channel_table.setUpdatesEnabled(True)
+
+    def on_tokens_dir_changed(self, _path):
+        """Updates the status of the profiles whose token file was just created or deleted."""
+        token_names = self.get_token_file_names()
+        changed = token_names ^ self._known_token_names
+        self._known_token_names = token_names
+        active_token = self.current_channel_profile.get('token_path') if self.current_channel_profile else None
+        for name in changed:
+            token_path = os.path.join(self.tokens_dir, name)
+            key = self._key_by_token_path.get(token_path)
+            if key is None or token_path == active_token:
+                continue
+            if name in token_names:
+                self.update_channel_status(key, "Token Exists", _COL_DARKGRAY)
+            else:
+                self.update_channel_status(key, "Needs Auth", _COL_BLACK)
 
     def reset_authentication_state(self):
         """Clears the current authentication details."""
@@ -669,26 +1815,26 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Not Authenticated", "Select & authenticate a channel first.")
             logging.warning("Blocked: Not authenticated.")
             return False
-        logging.debug(f"Auth OK. Channel: '{self.current_channel_profile.get('name', 'N/A')}'")
+        logging.debug("Auth OK. Channel: '%s'", self.current_channel_profile.get('name', 'N/A'))
         return True
 
     # --- SORT KEY FUNCTION (Used across tabs) ---
     def extract_chapter_sort_key(self, title):
-        """
-        Generates a sort key tuple (group, num, subsort, suffix, original_title)
-        Handles 'Course Introduction', 'Chapter N', 'Chapter NA'.
-        """
-        if not title:
-            return (999, 0, "", "")
-        title_lower_stripped = title.lower().strip()
-        if "course introduction" in title_lower_stripped:
-            return (-1, 0, "", title)
-        m = re.search(r'chapter\s+(\d+)([A-Za-z]*)', title_lower_stripped)
-        if m:
-            num, suffix = int(m.group(1)), m.group(2).upper()
-            subsort = 0 if not suffix else 1
-            return (num, subsort, suffix, title)
-        return (999, 0, "", title)
+        """Returns the chapter-aware sort key of a title, see chapter_sort_key."""
+        return chapter_sort_key(title)
+
+    def run_background_task(self, fn, on_finished):
+        """Runs fn() on a new QThread; on_finished(result, error) is then called on the UI thread."""
+        thread = QThread(self)
+        worker = TaskWorker(fn)
+        worker.moveToThread(thread)
+        task = (thread, worker)
+        self._background_tasks.add(task)  # Keeps both alive until the thread is done
+        thread.started.connect(worker.run)
+        worker.finished.connect(on_finished)
+        worker.finished.connect(thread.quit)
+        thread.finished.connect(lambda: self._background_tasks.discard(task))
+        thread.start()
 
     # ----------------------- Tab 2: Renaming UI & Logic -----------------------
     def init_rename_tab(self):
@@ -705,10 +1851,12 @@ class MainWindow(QMainWindow):
         self.show_scheme_btn.setToolTip("Load videos and generate proposed renames")
         self.show_scheme_btn.clicked.connect(self.show_rename_scheme)
         layout.addWidget(self.show_scheme_btn)
-        self.rename_table = QTableWidget()
-        self.rename_table.setColumnCount(3)
-        self.rename_table.setHorizontalHeaderLabels(["Original Title", "Proposed Title", "Proposed Desc"])
+        self.rename_model = RenameRowsModel(self)
+        self.rename_table = QTableView()
+        self.rename_table.setModel(self.rename_model)
         self.rename_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.rename_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.rename_table.verticalHeader().setDefaultSectionSize(TABLE_ROW_HEIGHT)
         layout.addWidget(self.rename_table)
         progress_layout = QHBoxLayout()
         self.rename_progress_bar = QProgressBar()
@@ -729,69 +1877,69 @@ class MainWindow(QMainWindow):
     def load_rename_playlist(self, show_messages=True):
         if not self.check_authentication():
             return
+        if self._rename_list_worker and self._rename_list_worker.isRunning():
+            return
         chan_name = self.current_channel_profile['name']
         logging.info(f"Load Rename lists: '{chan_name}'.")
         self.rename_log_window.append(f"Loading lists for '{chan_name}'...")
-        QApplication.processEvents()
-        try:
-            playlists = []
-            nextToken = None
-            pc, max_p = 0, 10
-            while pc < max_p:
-                pc += 1
-                req = self.youtube.playlists().list(part="snippet,contentDetails", mine=True, maxResults=50, pageToken=nextToken)
-                resp = req.execute()
-                items = resp.get("items", [])
-                playlists.extend(items)
-                logging.debug(f"Page {pc} ({len(items)}) rename lists {chan_name}")
-                nextToken = resp.get("nextPageToken")
-                if not nextToken:
-                    break
-            if pc >= max_p and nextToken:
-                logging.warning(f"Max pages rename lists {chan_name}.")
-                if show_messages:
-                    QMessageBox.warning(self, "Limit", f"Loaded {len(playlists)} lists.")
-            self.rename_playlist_combo.clear()
-            self.rename_playlists.clear()
-            if playlists:
-                sorted_lists = sorted(playlists, key=lambda p: p.get('snippet', {}).get('title', '').lower())
-                for item in sorted_lists:
-                    pid = item["id"]
-                    snip = item["snippet"]
-                    cd = item["contentDetails"]
-                    title = snip["title"]
-                    desc = snip.get("description", "")
-                    cnt = cd["itemCount"]
-                    disp = f"{title} ({cnt} videos) - {desc[:50]}"
-                    self.rename_playlists[disp] = pid
-                    self.rename_playlist_combo.addItem(disp)
-                msg = f"Loaded {len(playlists)} lists for '{chan_name}'."
-                logging.info(msg)
-                self.rename_log_window.append(msg)
-                if show_messages:
-                    QMessageBox.information(self, "Loaded", f"Found {len(playlists)} playlists.")
-            else:
-                msg = f"No lists found for '{chan_name}'."
-                logging.info(msg)
-                self.rename_log_window.append(msg)
-                if show_messages:
-                    QMessageBox.information(self, "No Playlists", msg)
-        except HttpError as e:
-            err = f"API Error load rename lists: {e}"
-            logging.exception(err)
-            self.rename_log_window.append(f"<font color='red'>{err}</font>")
+        self.load_rename_playlist_btn.setEnabled(False)
+        playlists = []
+        worker = PagedListWorker(self.youtube.playlists().list, self.credentials, 10,
+                                 part="snippet,contentDetails", mine=True, maxResults=50,
+                                 fields=PLAYLISTS_FIELDS)
+        worker.page_signal.connect(playlists.extend)
+        worker.finished_signal.connect(
+            lambda hit_limit: self.on_rename_playlists_loaded(chan_name, playlists, hit_limit, show_messages))
+        worker.error_signal.connect(lambda e: self.on_rename_playlists_failed(e, show_messages))
+        worker.finished.connect(lambda: self.load_rename_playlist_btn.setEnabled(True))
+        self._rename_list_worker = worker
+        worker.start()
+
+    def on_rename_playlists_loaded(self, chan_name, playlists, hit_limit, show_messages):
+        """Fills the rename playlist combo once every page has been fetched."""
+        if hit_limit:
+            logging.warning(f"Max pages rename lists {chan_name}.")
             if show_messages:
-                QMessageBox.critical(self, "API Error", err)
-        except Exception as e:
-            err = f"Error load rename lists: {e}"
-            logging.exception(err)
-            self.rename_log_window.append(f"<font color='red'>{err}</font>")
+                QMessageBox.warning(self, "Limit", f"Loaded {len(playlists)} lists.")
+        self.rename_playlist_combo.clear()
+        self.rename_playlists.clear()
+        if playlists:
+            sorted_lists = sorted(playlists, key=lambda p: p.get('snippet', {}).get('title', '').lower())
+            for item in sorted_lists:
+                pid = item["id"]
+                snip = item["snippet"]
+                cd = item["contentDetails"]
+                title = snip["title"]
+                desc = snip.get("description", "")
+                cnt = cd["itemCount"]
+                disp = f"{title} ({cnt} videos) - {desc[:50]}"
+                self.rename_playlists[disp] = pid
+                self.rename_playlist_combo.addItem(disp)
+            msg = f"Loaded {len(playlists)} lists for '{chan_name}'."
+            logging.info(msg)
+            self.rename_log_window.append(msg)
             if show_messages:
-                QMessageBox.critical(self, "Error", err)
+                QMessageBox.information(self, "Loaded", f"Found {len(playlists)} playlists.")
+        else:
+            msg = f"No lists found for '{chan_name}'."
+            logging.info(msg)
+            self.rename_log_window.append(msg)
+            if show_messages:
+                QMessageBox.information(self, "No Playlists", msg)
+
+    def on_rename_playlists_failed(self, e, show_messages):
+        is_api_error = isinstance(e, HttpError)
+        err = f"{'API Error' if is_api_error else 'Error'} load rename lists: {e}"
+        logging.error(err, exc_info=e)
+        self.rename_log_window.append(f"<font color='red'>{err}</font>")
+        if show_messages:
+            QMessageBox.critical(self, "API Error" if is_api_error else "Error", err)
 
     def show_rename_scheme(self):
         if not self.check_authentication():
             return
+        if self._rename_items_worker and self._rename_items_worker.isRunning():
+            return
         sel_txt = self.rename_playlist_combo.currentText()
         if not sel_txt:
             QMessageBox.warning(self, "No Selection", "Select playlist.")
@@ -805,89 +1953,92 @@ class MainWindow(QMainWindow):
         logging.info(f"Load scheme: '{chan_name}', PID: {pid}")
         self.rename_log_window.clear()
         self.rename_log_window.append(f"Loading videos: {sel_txt[:80]}...")
-        QApplication.processEvents()
+        self.show_scheme_btn.setEnabled(False)
+        videos = []
+        max_p = 20
+        worker = PagedListWorker(self.youtube.playlistItems().list, self.credentials, max_p,
+                                 part="snippet,contentDetails", playlistId=pid, maxResults=50,
+                                 fields=PLAYLIST_ITEMS_FIELDS)
+        worker.page_signal.connect(videos.extend)
+        worker.finished_signal.connect(lambda hit_limit: self.on_rename_items_loaded(pid, videos, hit_limit, max_p))
+        worker.error_signal.connect(lambda e: self.on_rename_items_failed(pid, e))
+        worker.finished.connect(lambda: self.show_scheme_btn.setEnabled(True))
+        self._rename_items_worker = worker
+        worker.start()
+
+    def on_rename_items_loaded(self, pid, videos, hit_limit, max_p):
+        """Sorts the fetched playlist items and builds the proposed rename scheme."""
+        if hit_limit:
+            logging.warning(f"Max pages rename items {pid}.")
+            self.rename_log_window.append(f"<font color='orange'>Warn: Fetched max {max_p*50}.</font>")
+        logging.info(f"Fetched {len(videos)} items from {pid}.")
         try:
-            videos = []
-            nextToken = None
-            pc, max_p = 0, 20
-            while pc < max_p:
-                pc += 1
-                req = self.youtube.playlistItems().list(part="snippet,contentDetails", playlistId=pid, maxResults=50, pageToken=nextToken)
-                resp = req.execute()
-                items = resp.get("items", [])
-                videos.extend(items)
-                logging.debug(f"Page {pc} ({len(items)}) rename items {pid}")
-                nextToken = resp.get("nextPageToken")
-                if not nextToken:
-                    break
-            if pc >= max_p and nextToken:
-                logging.warning(f"Max pages rename items {pid}.")
-                self.rename_log_window.append(f"<font color='orange'>Warn: Fetched max {max_p*50}.</font>")
-            logging.info(f"Fetched {len(videos)} items from {pid}.")
             try:
-                items_sort = [v for v in videos if v.get('snippet', {}).get('title')]
-                sorted_videos = sorted(items_sort, key=lambda v: self.extract_chapter_sort_key(v['snippet']['title']))
+                # Extract each key once, then sort on the precomputed keys
+                keyed = [(chapter_sort_key(v['snippet']['title']), v) for v in videos if v.get('snippet', {}).get('title')]
+                keyed.sort(key=operator.itemgetter(0))
+                sorted_videos = [v for _, v in keyed]
                 logging.info("Rename items sorted.")
             except Exception as e:
                 logging.exception("Rename sort failed.")
                 QMessageBox.warning(self, "Sort Warn", f"Sort fail: {e}")
                 sorted_videos = videos
-            self.rename_table.setRowCount(0)
-            rows_data = []
-            for vid_item in sorted_videos:
-                snip = vid_item.get("snippet", {})
-                cd = vid_item.get("contentDetails", {})
-                vid = cd.get("videoId")
-                orig_t = snip.get("title", "!!! MISSING !!!")
-                pos = snip.get("position", -1)
-                new_t, new_d = orig_t, orig_t
-                if "course introduction" in orig_t.lower().strip():
-                    pass
-                else:
-                    m = re.match(r'(Chapter\s+\d+[A-Za-z]?)\s*[-–—]?\s*(.*)', orig_t, re.IGNORECASE)
-                    if m:
-                        ch = m.group(1).strip()
-                        tpc = m.group(2).strip()
-                        new_t = f"{ch} - {tpc}" if tpc else ch
-                        new_d = tpc if tpc else orig_t
-                rows_data.append({"orig_title": orig_t, "new_title": new_t, "new_desc": new_d, "vid": vid, "pos": pos})
-            self.rename_table.setRowCount(len(rows_data))
-            for row, data in enumerate(rows_data):
-                i0 = QTableWidgetItem(data["orig_title"])
-                i0.setData(Qt.UserRole, data["vid"])
-                i0.setData(Qt.UserRole+1, data["pos"])
-                i0.setToolTip(f"ID: {data['vid']}\nPos: {data['pos']}")
-                i0.setFlags(i0.flags() & ~Qt.ItemIsEditable)
-                self.rename_table.setItem(row, 0, i0)
-                self.rename_table.setItem(row, 1, QTableWidgetItem(data["new_title"]))
-                self.rename_table.setItem(row, 2, QTableWidgetItem(data["new_desc"]))
-            self.rename_table.resizeColumnsToContents()
-            self.rename_table.resizeRowsToContents()
-            self.rename_log_window.append(f"Loaded {len(rows_data)} videos.")
+            # Rows are built lazily by the model as the table scrolls
+            self._rename_scheme_pid = pid
+            self.rename_model.set_items(sorted_videos)
+            self.rename_log_window.append(f"Loaded {self.rename_model.item_count()} videos.")
             logging.info("Rename scheme populated.")
-        except HttpError as e:
-            QMessageBox.critical(self, "API Error", f"Load videos failed: {e}")
-            self.rename_log_window.append(f"<font color='red'>Load fail: {e}</font>")
-            logging.exception(f"Load vid fail {pid}.")
+            self.load_rename_snippets(pid)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error: {e}")
             self.rename_log_window.append(f"<font color='red'>Error: {e}</font>")
             logging.exception("Error show rename.")
 
+    def load_rename_snippets(self, pid):
+        """Reads the loaded videos' current snippets in the background, so renaming can reuse them."""
+        vids = self.rename_model.video_ids()
+        if not vids:
+            return
+        videos_resource, credentials = self.youtube.videos(), self.credentials
+        self.run_background_task(
+            lambda: _fetch_video_snippets(videos_resource, vids, _thread_authorized_http(credentials)),
+            lambda snippets, error: self.on_rename_snippets_loaded(pid, snippets, error))
+
+    def on_rename_snippets_loaded(self, pid, snippets, error):
+        if pid != self._rename_scheme_pid:
+            logging.info(f"Dropped snippets of {pid}, another playlist was loaded meanwhile.")
+            return
+        if error is not None:
+            logging.warning(f"Snippet prefetch failed, rename will fetch them: {error}")
+            return
+        self.rename_model.add_snippets(snippets)
+        logging.info(f"Cached {len(snippets)} rename snippets.")
+
+    def on_rename_items_failed(self, pid, e):
+        if isinstance(e, HttpError):
+            QMessageBox.critical(self, "API Error", f"Load videos failed: {e}")
+            self.rename_log_window.append(f"<font color='red'>Load fail: {e}</font>")
+            logging.error(f"Load vid fail {pid}.", exc_info=e)
+        else:
+            QMessageBox.critical(self, "Error", f"Error: {e}")
+            self.rename_log_window.append(f"<font color='red'>Error: {e}</font>")
+            logging.error("Error show rename.", exc_info=e)
+
     def rename_videos(self):
         if not self.check_authentication():
             return
-        row_cnt = self.rename_table.rowCount()
-        if row_cnt == 0:
+        rows_data = self.rename_model.all_rows()
+        if not rows_data:
             QMessageBox.information(self, "No Videos", "Load first.")
             return
-        valid_rows = [r for r in range(row_cnt) if self.rename_table.item(r, 0) and self.rename_table.item(r, 0).data(Qt.UserRole)]
+        valid_rows = [r for r, data in enumerate(rows_data) if data.get("vid")]
         if not valid_rows:
             QMessageBox.information(self, "No Valid Videos", "No IDs found.")
             return
         num_rename = len(valid_rows)
         chan_name = self.current_channel_profile['name']
         p_name = self.rename_playlist_combo.currentText().split(' (')[0]
+        pid = self.rename_playlists.get(self.rename_playlist_combo.currentText())
         reply = QMessageBox.question(self, 'Confirm', f"Rename {num_rename} for '{chan_name}'/'{p_name}'?", QMessageBox.Yes|QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.No:
             logging.info("User cancel rename.")
@@ -897,88 +2048,44 @@ class MainWindow(QMainWindow):
         self.rename_progress_bar.setValue(0)
         self.rename_log_window.clear()
         self.rename_log_window.append(f"Renaming '{p_name}'...")
-        QApplication.processEvents()
-        ok_cnt, fail_cnt, proc_cnt = 0, 0, 0
-        for row_idx in valid_rows:
-            proc_cnt += 1
-            vid = None
-            row = row_idx
-            try:
-                i0 = self.rename_table.item(row, 0)
-                i1 = self.rename_table.item(row, 1)
-                i2 = self.rename_table.item(row, 2)
-                if not (i0 and i1 and i2):
-                    logging.warning(f"Row {row+1}: Skip miss item.")
-                    fail_cnt += 1
-                    continue
-                vid = i0.data(Qt.UserRole)
-                pos = i0.data(Qt.UserRole+1)
-                orig_t = i0.text()
-                new_t = i1.text().strip()
-                new_d = i2.text().strip()
-                if not vid:
-                    logging.warning(f"Row {row+1}({pos}): Skip miss ID.")
-                    fail_cnt += 1
-                    continue
-                if not new_t:
-                    logging.warning(f"Row {row+1}({pos}): Skip {vid} empty title.")
-                    fail_cnt += 1
-                    continue
-                self.rename_log_window.append(f"Proc {row+1}(ID:{vid}) '{orig_t[:50]}...'")
-                QApplication.processEvents()
-                vid_resp = self.youtube.videos().list(part="snippet", id=vid).execute()
-                if not vid_resp.get("items"):
-                    logging.error(f"FAIL R{row+1}: Vid {vid} not found.")
-                    self.rename_log_window.append(f"<font color='red'>FAIL R{row+1}: Vid {vid} not found.</font>")
-                    fail_cnt += 1
-                    continue
-                curr_snip = vid_resp["items"][0]["snippet"]
-                curr_t = curr_snip.get('title', '')
-                curr_d = curr_snip.get('description', '')
-                curr_cat = curr_snip.get("categoryId")
-                if not curr_cat:
-                    logging.error(f"FAIL R{row+1}: Vid {vid} no catId.")
-                    self.rename_log_window.append(f"<font color='red'>FAIL R{row+1}({vid}): No catId!</font>")
-                    fail_cnt += 1
-                    continue
-                t_chg, d_chg = curr_t != new_t, curr_d != new_d
-                if not t_chg and not d_chg:
-                    msg = f"Skip R{row+1}: No change {vid}."
-                    logging.info(msg)
-                    self.rename_log_window.append(msg)
-                else:
-                    snip_upd = {"id": vid, "snippet": {"title": new_t, "description": new_d, "categoryId": curr_cat, "tags": curr_snip.get("tags", [])}}
-                    if "defaultLanguage" in curr_snip:
-                        snip_upd["snippet"]["defaultLanguage"] = curr_snip["defaultLanguage"]
-                    if "defaultAudioLanguage" in curr_snip:
-                        snip_upd["snippet"]["defaultAudioLanguage"] = curr_snip["defaultAudioLanguage"]
-                    logging.debug(f"Update body: {snip_upd}")
-                    req = self.youtube.videos().update(part="snippet", body=snip_upd)
-                    resp = req.execute()
-                    chgs = [c for c, chgd in [("T", t_chg), ("D", d_chg)] if chgd]
-                    chg_s = "&".join(chgs) if chgs else "Meta"
-                    msg = f"OK R{row+1}: Upd {chg_s} {vid}:'{new_t[:50]}...'"
-                    logging.info(f"Upd {vid}")
-                    self.rename_log_window.append(msg)
-                ok_cnt += 1
-            except HttpError as e:
-                err_msg = f"FAIL R{row+1}({vid}): API Err {e.resp.status}"
-                try:
-                    c = json.loads(e.content)
-                    err_msg += f"-{c.get('error', {}).get('message', '')}"
-                except Exception:
-                    pass
-                logging.exception(f"API Err upd R{row+1}")
-                self.rename_log_window.append(f"<font color='red'>{err_msg}</font>")
-                fail_cnt += 1
-            except Exception as e:
-                err_msg = f"FAIL R{row+1}({vid}): Err {type(e).__name__}"
-                logging.exception(f"Err upd R{row+1}")
-                self.rename_log_window.append(f"<font color='red'>{err_msg}: {e}</font>")
-                fail_cnt += 1
-            finally:
-                self.rename_progress_bar.setValue(proc_cnt)
-                QApplication.processEvents()
+        # The worker gets copies, the table can be edited while it runs
+        rows = [(r, dict(rows_data[r])) for r in valid_rows]
+        snippets = {}
+        for _, data in rows:
+            snip = self.rename_model.snippet(data["vid"])
+            if snip is not None:
+                snippets[data["vid"]] = dict(snip)
+        thread = QThread(self)
+        worker = RenameWorker(self.youtube.videos(), self.credentials, rows, snippets)
+        worker.moveToThread(thread)
+        worker.progress.connect(self.rename_progress_bar.setValue)
+        worker.log.connect(self.buffer_rename_log)
+        worker.snippets_signal.connect(self.rename_model.update_snippets)
+        worker.finished.connect(lambda proc, ok, fail: self.on_rename_finished(p_name, pid, proc, ok, fail))
+        worker.finished.connect(thread.quit)
+        thread.started.connect(worker.run)
+        self.rename_btn.setEnabled(False)
+        self._rename_thread, self._rename_worker = thread, worker
+        thread.start()
+
+    def buffer_rename_log(self, msg):
+        # Plain lines are escaped, they are shown as part of an HTML block
+        self._rename_log_buffer.append(msg if msg.startswith("<") else html.escape(msg))
+        if len(self._rename_log_buffer) >= LOG_FLUSH_LINES:
+            self.flush_rename_log()
+
+    def flush_rename_log(self):
+        """Appends the buffered lines as one block: one document layout and scroll instead of one per line."""
+        if self._rename_log_buffer:
+            self.rename_log_window.append("<br>".join(self._rename_log_buffer))
+            self._rename_log_buffer.clear()
+
+    def on_rename_finished(self, p_name, pid, proc_cnt, ok_cnt, fail_cnt):
+        self.flush_rename_log()
+        self.rename_btn.setEnabled(True)
+        # Neither the checking tab nor the Excel export may use the titles cached before this rename
+        _invalidate_cached_list(f"playlistitems:{pid}")
+        self._excel_items_cache.pop(pid, None)
         final = f"Rename done '{p_name}'. Proc:{proc_cnt}, OK:{ok_cnt}, Fail:{fail_cnt}."
         self.rename_log_window.append(f"\n<b>{final}</b>")
         logging.info(final)
@@ -1010,12 +2117,17 @@ class MainWindow(QMainWindow):
         playlist_layout.addWidget(self.check_playlist_combo, 1)
         playlist_layout.addWidget(self.show_playlist_names_btn)
         layout.addLayout(playlist_layout)
-        self.check_table = QTableWidget()
-        self.check_table.setColumnCount(3)
-        self.check_table.setHorizontalHeaderLabels(["#", "Folder Filename", "YouTube Title"])
-        self.check_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        self.check_force_refresh_cb = QCheckBox("Force refresh (ask YouTube instead of using cached lists)")
+        layout.addWidget(self.check_force_refresh_cb)
+        self.check_model = CheckTableModel(self)
+        self.check_table = QTableView()
+        self.check_table.setModel(self.check_model)
+        self.check_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Interactive)
+        self.check_table.setColumnWidth(0, 50)
         self.check_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.check_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        self.check_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.check_table.verticalHeader().setDefaultSectionSize(TABLE_ROW_HEIGHT)
         layout.addWidget(self.check_table)
         compare_btn = QPushButton("Compare Folder vs Playlist")
         compare_btn.clicked.connect(self.compare_folder_playlist)
@@ -1034,13 +2146,11 @@ class MainWindow(QMainWindow):
             self.selected_folder_path_label.setText(folder)
 
     def clear_check_table_column(self, col_index):
-        for i in range(self.check_table.rowCount()):
-            item = self.check_table.item(i, col_index)
-            if item:
-                item.setText("")
-                item.setBackground(QColor("white"))
-            else:
-                self.check_table.setItem(i, col_index, QTableWidgetItem(""))
+        if col_index == 1:
+            self.folder_files = []
+        else:
+            self.playlist_titles = []
+        self.check_model.set_names(col_index, [])
 
     def load_folder_names(self):
         if not self.folder_path or not os.path.isdir(self.folder_path):
@@ -1051,37 +2161,18 @@ class MainWindow(QMainWindow):
         QApplication.processEvents()
         try:
             vid_ext = ('.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm')
-            files = [f for f in os.listdir(self.folder_path) if os.path.isfile(os.path.join(self.folder_path, f)) and f.lower().endswith(vid_ext)]
-            basenames = [os.path.splitext(f)[0] for f in files]
-            self.folder_files = sorted(basenames, key=self.extract_chapter_sort_key)
+            # One scandir pass: the entry type comes with the listing, no stat() per file
+            with os.scandir(self.folder_path) as entries:
+                basenames = [os.path.splitext(e.name)[0] for e in entries
+                             if e.name.lower().endswith(vid_ext) and e.is_file(follow_symlinks=False)]
+            self.folder_files = sorted(basenames, key=check_list_sort_key)
             logging.info(f"Found {len(self.folder_files)} folder names.")
-            req_rows = max(self.check_table.rowCount(), len(self.folder_files))
-            self.check_table.setRowCount(req_rows)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Load folder fail: {e}")
             self.check_log_window.append(f"<font color='red'>Folder fail: {e}</font>")
             logging.exception(f"Folder fail {self.folder_path}")
             return
-        for i in range(req_rows):
-            num_i = self.check_table.item(i, 0)
-            if not num_i:
-                num_i = QTableWidgetItem(str(i+1))
-                num_i.setTextAlignment(Qt.AlignCenter)
-                self.check_table.setItem(i, 0, num_i)
-            f_name = self.folder_files[i] if i < len(self.folder_files) else ""
-            f_item = self.check_table.item(i, 1)
-            if f_item:
-                f_item.setText(f_name)
-                f_item.setBackground(QColor("white"))
-            else:
-                self.check_table.setItem(i, 1, QTableWidgetItem(f_name))
-            p_item = self.check_table.item(i, 2)
-            if not p_item:
-                self.check_table.setItem(i, 2, QTableWidgetItem(""))
-            elif i >= len(self.folder_files):
-                p_item.setBackground(QColor("white"))
-        self.check_table.resizeColumnsToContents()
-        self.check_table.resizeRowsToContents()
+        self.check_model.set_names(1, self.folder_files)
         self.check_log_window.append(f"OK: Load {len(self.folder_files)} names (Col 2).")
         QMessageBox.information(self, "Folder Loaded", f"Loaded {len(self.folder_files)} filenames.")
 
@@ -1091,22 +2182,28 @@ class MainWindow(QMainWindow):
         chan_name = self.current_channel_profile['name']
         logging.info(f"Load Check lists: '{chan_name}'.")
         self.check_log_window.append(f"Loading lists '{chan_name}'...")
-        QApplication.processEvents()
+        cache_key = f"playlists:{os.path.basename(self.current_channel_profile['token_path'])}"
+        list_method, credentials = self.youtube.playlists().list, self.credentials
+        revalidate = self.check_force_refresh_cb.isChecked()
+
+        def fetch():
+            http = _thread_authorized_http(credentials)
+            return _cached_list(
+                cache_key,
+                lambda etag: _list_all_pages(list_method, 10, etag, http=http, part="snippet,contentDetails",
+                                             mine=True, maxResults=50, fields=PLAYLISTS_FIELDS),
+                PLAYLISTS_CACHE_TTL, revalidate)
+        self.load_check_playlist_btn.setEnabled(False)
+        self.run_background_task(
+            fetch, lambda result, error: self.on_check_playlists_loaded(chan_name, result, error, show_messages))
+
+    def on_check_playlists_loaded(self, chan_name, result, error, show_messages):
+        self.load_check_playlist_btn.setEnabled(True)
         try:
-            playlists = []
-            nextToken = None
-            pc, max_p = 0, 10
-            while pc < max_p:
-                pc += 1
-                req = self.youtube.playlists().list(part="snippet,contentDetails", mine=True, maxResults=50, pageToken=nextToken)
-                resp = req.execute()
-                items = resp.get("items", [])
-                playlists.extend(items)
-                logging.debug(f"P{pc}({len(items)}) check lists {chan_name}")
-                nextToken = resp.get("nextPageToken")
-                if not nextToken:
-                    break
-            if pc >= max_p and nextToken:
+            if error is not None:
+                raise error
+            playlists, hit_limit = result
+            if hit_limit:
                 logging.warning(f"Max pages check lists {chan_name}.")
                 if show_messages:
                     QMessageBox.warning(self, "Limit", f"Load {len(playlists)} lists.")
@@ -1163,56 +2260,40 @@ class MainWindow(QMainWindow):
         chan_name = self.current_channel_profile['name']
         logging.info(f"Load check titles: '{chan_name}', PID: {pid}")
         self.check_log_window.append(f"Loading names: {sel_txt[:80]}...")
-        QApplication.processEvents()
+        max_p = 20
+        list_method, credentials = self.youtube.playlistItems().list, self.credentials
+        revalidate = self.check_force_refresh_cb.isChecked()
+
+        def fetch():
+            http = _thread_authorized_http(credentials)
+            return _cached_list(
+                f"playlistitems:{pid}",
+                lambda etag: _list_all_pages(list_method, max_p, etag, http=http, part="snippet",
+                                             playlistId=pid, maxResults=50, fields=PLAYLIST_TITLES_FIELDS),
+                PLAYLIST_ITEMS_CACHE_TTL, revalidate)
+        self.show_playlist_names_btn.setEnabled(False)
+        self.run_background_task(fetch, lambda result, error: self.on_check_titles_loaded(pid, max_p, result, error))
+
+    def on_check_titles_loaded(self, pid, max_p, result, error):
+        self.show_playlist_names_btn.setEnabled(True)
         try:
-            videos = []
-            nextToken = None
-            pc, max_p = 0, 20
-            while pc < max_p:
-                pc += 1
-                req = self.youtube.playlistItems().list(part="snippet", playlistId=pid, maxResults=50, pageToken=nextToken)
-                resp = req.execute()
-                items = resp.get("items", [])
-                videos.extend(items)
-                logging.debug(f"P{pc}({len(items)}) check titles {pid}")
-                nextToken = resp.get("nextPageToken")
-                if not nextToken:
-                    break
-            if pc >= max_p and nextToken:
+            if error is not None:
+                raise error
+            videos, hit_limit = result
+            if hit_limit:
                 logging.warning(f"Max pages check titles {pid}.")
                 self.check_log_window.append(f"<font color='orange'>Warn: Fetched max {max_p*50} items.</font>")
             logging.info(f"Fetched {len(videos)} items {pid}.")
             try:
-                items_titles = [v for v in videos if v.get('snippet', {}).get('title')]
-                sorted_videos = sorted(items_titles, key=lambda v: self.extract_chapter_sort_key(v['snippet']['title']))
-                self.playlist_titles = [v['snippet']['title'] for v in sorted_videos]
+                # Only the titles are kept, so sort them directly on the cached key
+                titles = [v['snippet']['title'] for v in videos if v.get('snippet', {}).get('title')]
+                self.playlist_titles = sorted(titles, key=check_list_sort_key)
                 logging.info("Check titles sorted.")
             except Exception as e:
                 logging.exception("Check sort fail.")
                 QMessageBox.warning(self, "Sort Warn", f"Sort fail: {e}")
                 self.playlist_titles = [v['snippet']['title'] for v in videos if v.get('snippet', {}).get('title')]
-            req_rows = max(self.check_table.rowCount(), len(self.playlist_titles))
-            self.check_table.setRowCount(req_rows)
-            for i in range(req_rows):
-                num_i = self.check_table.item(i, 0)
-                if not num_i:
-                    num_i = QTableWidgetItem(str(i+1))
-                    num_i.setTextAlignment(Qt.AlignCenter)
-                    self.check_table.setItem(i, 0, num_i)
-                f_item = self.check_table.item(i, 1)
-                if not f_item:
-                    self.check_table.setItem(i, 1, QTableWidgetItem(""))
-                elif i >= len(self.playlist_titles):
-                    f_item.setBackground(QColor("white"))
-                p_title = self.playlist_titles[i] if i < len(self.playlist_titles) else ""
-                p_item = self.check_table.item(i, 2)
-                if p_item:
-                    p_item.setText(p_title)
-                    p_item.setBackground(QColor("white"))
-                else:
-                    self.check_table.setItem(i, 2, QTableWidgetItem(p_title))
-            self.check_table.resizeColumnsToContents()
-            self.check_table.resizeRowsToContents()
+            self.check_model.set_names(2, self.playlist_titles)
             self.check_log_window.append(f"OK: Load {len(self.playlist_titles)} names (Col 3).")
             QMessageBox.information(self, "Names Loaded", f"Loaded {len(self.playlist_titles)} titles.")
         except HttpError as e:
@@ -1225,7 +2306,7 @@ class MainWindow(QMainWindow):
             logging.exception("Error show check names.")
 
     def compare_folder_playlist(self):
-        row_cnt = self.check_table.rowCount()
+        row_cnt = self.check_model.rowCount()
         if row_cnt == 0 or (not self.folder_files and not self.playlist_titles):
             QMessageBox.information(self, "No Data", "Load folder/playlist first.")
             return
@@ -1236,11 +2317,6 @@ class MainWindow(QMainWindow):
         p_list = self.playlist_titles
         msgs = []
         discrep = False
-        for r in range(row_cnt):
-            for c in range(1, 3):
-                item = self.check_table.item(r, c)
-                if item:
-                    item.setBackground(QColor("white"))
         len_f, len_p = len(f_list), len(p_list)
         if len_f != len_p:
             msg = f"Count Mismatch: F={len_f}, P={len_p}."
@@ -1250,42 +2326,31 @@ class MainWindow(QMainWindow):
         else:
             msgs.append(f"Count Match: {len_f}.")
             logging.info(f"Counts ok: {len_f}")
-        seen = {}
+        seen = Counter()
         f_map = {}
         for t in p_list:
             tl = t.lower()
-            seen[tl] = seen.get(tl, 0) + 1
-            if tl not in f_map:
-                f_map[tl] = t
+            seen[tl] += 1
+            f_map.setdefault(tl, t)
         dups = [f"'{f_map[tl]}' ({c}x)" for tl, c in seen.items() if c > 1]
         if dups:
             msg = "Dup Playlist Titles: " + ", ".join(dups)
             msgs.append(f"<font color='orange'>{msg}</font>")
             logging.warning(msg)
             discrep = True
+        # Compare the name lists directly, then tint only the mismatched rows
+        n = max(len_f, len_p)
+        f_txts = [t.strip() for t in f_list] + [""] * (n - len_f)
+        p_txts = [t.strip() for t in p_list] + [""] * (n - len_p)
+        mm_rows = [i for i, (f_txt, p_txt) in enumerate(zip(f_txts, p_txts)) if f_txt != p_txt]
         mismatches = []
-        mm_color = QColor(255, 192, 203)
-        max_r = self.check_table.rowCount()
-        for i in range(max_r):
-            i_f = self.check_table.item(i, 1)
-            i_p = self.check_table.item(i, 2)
-            f_txt = (i_f.text().strip() if i_f else "")
-            p_txt = (i_p.text().strip() if i_p else "")
-            report = False
-            if f_txt != p_txt:
-                if i < min(len_f, len_p):
-                    report = True
-                elif i < max(len_f, len_p):
-                    report = True
-            if report:
-                mm_msg = f"R{i+1}: F='{f_txt}' != P='{p_txt}'"
-                mismatches.append(mm_msg)
-                logging.warning(f"Mismatch {i+1}: F='{f_txt}', P='{p_txt}'")
-                discrep = True
-                if i_f:
-                    i_f.setBackground(mm_color)
-                if i_p:
-                    i_p.setBackground(mm_color)
+        for i in mm_rows:
+            f_txt, p_txt = f_txts[i], p_txts[i]
+            mismatches.append(f"R{i+1}: F='{f_txt}' != P='{p_txt}'")
+            logging.warning(f"Mismatch {i+1}: F='{f_txt}', P='{p_txt}'")
+        if mm_rows:
+            discrep = True
+        self.check_model.set_mismatch_rows(mm_rows)
         if mismatches:
             msgs.append("<font color='red'><b>Mismatches:</b></font><br>" + "<br>".join(mismatches))
         self.check_log_window.append("\n--- Compare Results ---")
@@ -1309,13 +2374,18 @@ class MainWindow(QMainWindow):
         load_layout.addWidget(self.load_excel_playlists_btn)
         load_layout.addStretch()
         layout.addLayout(load_layout)
-        self.excel_playlist_table = QTableWidget()
-        self.excel_playlist_table.setColumnCount(2)
-        self.excel_playlist_table.setHorizontalHeaderLabels(["Select", "Playlist Details"])
-        self.excel_playlist_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        self.excel_playlist_model = ExcelPlaylistsModel(self)
+        self.excel_playlist_table = QTableView()
+        self.excel_playlist_table.setModel(self.excel_playlist_model)
+        self.excel_playlist_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Interactive)
+        self.excel_playlist_table.setColumnWidth(0, 60)
         self.excel_playlist_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.excel_playlist_table.verticalHeader().setVisible(False)
-        self.excel_playlist_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        # Every row shows three lines (title, description, video count)
+        self.excel_playlist_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.excel_playlist_table.verticalHeader().setDefaultSectionSize(
+            self.excel_playlist_table.fontMetrics().lineSpacing() * 3 + 8)
+        self.excel_playlist_table.setEditTriggers(QTableView.NoEditTriggers)
         layout.addWidget(QLabel("Select Playlists for Excel:"))
         layout.addWidget(self.excel_playlist_table)
         progress_layout = QHBoxLayout()
@@ -1328,6 +2398,8 @@ class MainWindow(QMainWindow):
         self.excel_log_window.setFixedHeight(200)
         layout.addWidget(QLabel("Log:"))
         layout.addWidget(self.excel_log_window)
+        self.excel_force_refresh_cb = QCheckBox("Force refresh (fetch playlists exported before again)")
+        layout.addWidget(self.excel_force_refresh_cb)
         self.generate_excel_btn = QPushButton("Generate Excel(s)")
         self.generate_excel_btn.clicked.connect(self.generate_selected_excels)
         layout.addWidget(self.generate_excel_btn)
@@ -1336,55 +2408,42 @@ class MainWindow(QMainWindow):
     def load_excel_playlists(self, show_messages=True):
         if not self.check_authentication():
             return
+        if self._loading_excel_playlists:
+            logging.info("Load Excel lists: already in progress.")
+            self.excel_log_window.append("<i>Load already in progress</i>")
+            return
+        self._loading_excel_playlists = True
+        self.load_excel_playlists_btn.setEnabled(False)
         chan_name = self.current_channel_profile['name']
         logging.info(f"Load Excel lists: '{chan_name}'.")
         self.excel_log_window.setText(f"Loading lists '{chan_name}'...")
-        QApplication.processEvents()
+        list_method, credentials = self.youtube.playlists().list, self.credentials
+
+        def fetch():
+            return _list_all_pages(list_method, 10, http=_thread_authorized_http(credentials),
+                                   part="snippet,contentDetails", mine=True, maxResults=50, fields=PLAYLISTS_FIELDS)
+        self.run_background_task(
+            fetch, lambda result, error: self.on_excel_playlists_loaded(chan_name, result, error, show_messages))
+
+    def on_excel_playlists_loaded(self, chan_name, result, error, show_messages):
         try:
-            playlists = []
-            nextToken = None
-            pc, max_p = 0, 10
-            while pc < max_p:
-                pc += 1
-                req = self.youtube.playlists().list(part="snippet,contentDetails", mine=True, maxResults=50, pageToken=nextToken)
-                resp = req.execute()
-                items = resp.get("items", [])
-                playlists.extend(items)
-                logging.debug(f"P{pc}({len(items)}) excel lists {chan_name}")
-                nextToken = resp.get("nextPageToken")
-                if not nextToken:
-                    break
-            if pc >= max_p and nextToken:
+            if error is not None:
+                raise error
+            playlists = result["items"]
+            if result["hit_limit"]:
                 logging.warning(f"Max pages excel lists {chan_name}.")
                 if show_messages:
                     QMessageBox.warning(self, "Limit", f"Load {len(playlists)} lists.")
-            self.excel_playlist_table.setRowCount(0)
             self.excel_playlists_data.clear()
+            sorted_lists = sorted(playlists, key=lambda p: p.get('snippet', {}).get('title', '').lower())
+            for item in sorted_lists:
+                pid = item["id"]
+                snip = item["snippet"]
+                self.excel_playlists_data[pid] = {'id': pid, 'title': snip["title"],
+                                                  'description': snip.get("description", ""),
+                                                  'count': item["contentDetails"]["itemCount"]}
+            self.excel_playlist_model.set_playlists(list(self.excel_playlists_data.values()))
             if playlists:
-                sorted_lists = sorted(playlists, key=lambda p: p.get('snippet', {}).get('title', '').lower())
-                self.excel_playlist_table.setRowCount(len(sorted_lists))
-                for row, item in enumerate(sorted_lists):
-                    pid = item["id"]
-                    snip = item["snippet"]
-                    cd = item["contentDetails"]
-                    title = snip["title"]
-                    desc = snip.get("description", "")
-                    cnt = cd["itemCount"]
-                    self.excel_playlists_data[pid] = {'id': pid, 'title': title, 'description': desc, 'row': row}
-                    cb = QCheckBox()
-                    cb_widget = QWidget()
-                    cb_l = QHBoxLayout(cb_widget)
-                    cb_l.addWidget(cb)
-                    cb_l.setAlignment(Qt.AlignCenter)
-                    cb_l.setContentsMargins(0, 0, 0, 0)
-                    self.excel_playlist_table.setCellWidget(row, 0, cb_widget)
-                    desc_prev = desc[:100].replace('\n', ' ') + ('...' if len(desc) > 100 else '')
-                    disp = f"{title}\nDesc:{desc_prev}\n({cnt} videos)"
-                    item1 = QTableWidgetItem(disp)
-                    item1.setToolTip(f"ID:{pid}\nTitle:{title}\nVideos:{cnt}\nDesc:{desc}")
-                    item1.setData(Qt.UserRole, pid)
-                    self.excel_playlist_table.setItem(row, 1, item1)
-                self.excel_playlist_table.resizeRowsToContents()
                 msg = f"Load {len(playlists)} excel lists '{chan_name}'."
                 logging.info(msg)
                 self.excel_log_window.append(msg)
@@ -1408,27 +2467,21 @@ class MainWindow(QMainWindow):
             self.excel_log_window.append(f"<font color='red'>{err}</font>")
             if show_messages:
                 QMessageBox.critical(self, "Error", err)
-
-    def video_sort_key(self, title):
-        return self.extract_chapter_sort_key(title)
+        finally:
+            self._loading_excel_playlists = False
+            self.load_excel_playlists_btn.setEnabled(True)
 
     def generate_selected_excels(self):
         if not self.check_authentication():
             return
+        if self._generating_excels:
+            logging.info("Excel Gen: already in progress.")
+            self.excel_log_window.append("<i>Generation already in progress</i>")
+            return
         chan_name = self.current_channel_profile['name']
-        sel_ids = []
-        for row in range(self.excel_playlist_table.rowCount()):
-            cb_w = self.excel_playlist_table.cellWidget(row, 0)
-            cb = cb_w.findChild(QCheckBox) if cb_w else None
-            item1 = self.excel_playlist_table.item(row, 1)
-            if cb and cb.isChecked() and item1:
-                pid = item1.data(Qt.UserRole)
-                if pid and pid in self.excel_playlists_data:
-                    sel_ids.append(pid)
-                else:
-                    logging.warning(f"Excel Gen: Bad ID '{pid}' R{row}.")
-                    self.excel_log_window.append(f"<font color='orange'>Warn: Cannot process R{row+1}.</font>")
-        if not sel_ids:
+        # The worker gets copies, the list can be reloaded while it runs
+        sel_playlists = [dict(p) for p in self.excel_playlist_model.checked_playlists()]
+        if not sel_playlists:
             QMessageBox.warning(self, "No Selection", "Select playlists.")
             return
         try:
@@ -1443,55 +2496,41 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Folder Error", f"Cannot create dir '{dir_name}': {e}")
             logging.exception("Output dir fail.")
             return
-        total = len(sel_ids)
+        total = len(sel_playlists)
         self.excel_progress_bar.setMaximum(total)
         self.excel_progress_bar.setValue(0)
         self.excel_log_window.clear()
         self.excel_log_window.append(f"Gen Excel for {total} lists from '{chan_name}'...")
         self.excel_log_window.append(f"Output: {out_dir}")
-        QApplication.processEvents()
-        ok_cnt, fail_cnt = 0, 0
-        for i, pid in enumerate(sel_ids):
-            p_data = self.excel_playlists_data.get(pid)
-            if not p_data:
-                fail_cnt += 1
-                logging.error(f"Skip Excel: Data miss ID {pid}.")
-                self.excel_log_window.append(f"<font color='red'>--> FAIL: Data miss ID {pid}.</font>")
-                self.excel_progress_bar.setValue(i+1)
-                continue
-            p_title = p_data.get('title', 'UNKNOWN')
-            p_desc = p_data.get('description', '')
-            self.excel_log_window.append(f"\nProc {i+1}/{total}: '{p_title}' (ID: {pid})")
-            QApplication.processEvents()
-            try:
-                self.generate_excel_for_playlist(pid, p_title, p_desc, out_dir)
-                self.excel_log_window.append(f"--> OK: Gen '{p_title}'.")
-                logging.info(f"OK: Excel {pid} ('{p_title}')")
-                ok_cnt += 1
-            except HttpError as e:
-                fail_cnt += 1
-                err_d = f"{e.resp.status} {e.reason}"
-                try:
-                    c = json.loads(e.content)
-                    err_d += f"-{c.get('error', {}).get('message', '')}"
-                except Exception:
-                    pass
-                msg = f"--> FAIL(API) '{p_title}':{err_d}"
-                self.excel_log_window.append(f"<font color='red'>{msg}</font>")
-                logging.exception(f"API Err Excel {pid}")
-            except ValueError as e:
-                fail_cnt += 1
-                msg = f"--> FAIL '{p_title}': {e}"
-                self.excel_log_window.append(f"<font color='red'>{msg}</font>")
-                logging.error(f"ValErr Excel {pid}: {e}")
-            except Exception as e:
-                fail_cnt += 1
-                msg = f"--> FAIL(Err) '{p_title}':{type(e).__name__}"
-                self.excel_log_window.append(f"<font color='red'>{msg}: {e}</font>")
-                logging.exception(f"Err Excel {pid}")
-            finally:
-                self.excel_progress_bar.setValue(i+1)
-                QApplication.processEvents()
+        # A playlist exported before this session is reused while its video count is unchanged
+        cached_items = {}
+        if not self.excel_force_refresh_cb.isChecked():
+            for p in sel_playlists:
+                count, fetched = self._excel_items_cache.get(p['id'], (None, None))
+                if fetched is not None and count == p['count']:
+                    cached_items[p['id']] = fetched
+        if cached_items:
+            logging.info(f"Excel Gen: {len(cached_items)} of {total} playlists from the session cache.")
+        thread = QThread(self)
+        worker = ExcelWorker(self.youtube.playlistItems().list, self.credentials, sel_playlists, out_dir, cached_items)
+        worker.moveToThread(thread)
+        worker.progress.connect(self.excel_progress_bar.setValue)
+        worker.log.connect(self.excel_log_window.append)
+        worker.items_signal.connect(self.cache_excel_items)
+        worker.finished.connect(lambda ok, fail: self.on_excel_finished(chan_name, out_dir, ok, fail))
+        worker.finished.connect(thread.quit)
+        thread.started.connect(worker.run)
+        self._generating_excels = True
+        self.generate_excel_btn.setEnabled(False)
+        self._excel_thread, self._excel_worker = thread, worker
+        thread.start()
+
+    def cache_excel_items(self, pid, count, fetched):
+        self._excel_items_cache[pid] = (count, fetched)
+
+    def on_excel_finished(self, chan_name, out_dir, ok_cnt, fail_cnt):
+        self._generating_excels = False
+        self.generate_excel_btn.setEnabled(True)
         final = f"Excel done '{chan_name}'. OK:{ok_cnt}, Fail:{fail_cnt}."
         self.excel_log_window.append(f"\n<b>{final}</b>")
         logging.info(final)
@@ -1505,137 +2544,6 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logging.warning(f"Cannot open folder '{out_dir}': {e}")
 
-    # *** THIS FUNCTION CONTAINS THE SPECIFIC FIX ***
-    def generate_excel_for_playlist(self, playlist_id, playlist_title, playlist_description, output_dir):
-        """Fetches videos, sorts them, extracts data, and saves to an Excel file."""
-        logging.info(f"Generating Excel for Playlist ID: {playlist_id}, Title: '{playlist_title}'")
-        # 1. Parse Codes
-        course_code, lang_code = "UNKNOWN", "UNKNOWN"
-        match = re.match(r'PL_([^_]+(?:_[^_]+)*)_([a-zA-Z0-9]+)', playlist_title, re.IGNORECASE)
-        if match:
-            course_code, lang_code = match.group(1), match.group(2)
-            logging.info(f"Codes: '{course_code}', '{lang_code}' from '{playlist_title}'")
-        else:
-            logging.warning(f"Title '{playlist_title}' != format.")
-            self.excel_log_window.append(f"<font color='orange'>   Warn: Title '{playlist_title}' format mismatch.</font>")
-        # 2. Filename
-        s_desc = sanitize_filename(playlist_description or "NoDesc", True)
-        s_title = sanitize_filename(playlist_title, True)
-        max_l = 80
-        combo = f"{s_desc}_{s_title}"
-        fname = (combo[:max_l] + '...' if len(combo) > max_l else combo) + ".xlsx"
-        fpath = os.path.join(output_dir, fname)
-        logging.info(f"Excel path: {fpath}")
-        # 3. Fetch items
-        items = []
-        nextPageToken = None
-        self.excel_log_window.append("   Fetching items...")
-        QApplication.processEvents()
-        pc, max_p = 0, 20
-        while pc < max_p:
-            pc += 1
-            req = self.youtube.playlistItems().list(part="snippet,contentDetails", playlistId=playlist_id, maxResults=50, pageToken=nextPageToken)
-            resp = req.execute()
-            fetched = resp.get("items", [])
-            items.extend(fetched)
-            logging.debug(f"Page {pc} ({len(fetched)} items) excel {playlist_id}")
-            nextPageToken = resp.get("nextPageToken")
-            if not nextPageToken:
-                break
-        if pc >= max_p and nextPageToken:
-            logging.warning(f"Max pages excel fetch {playlist_id}.")
-            self.excel_log_window.append(f"<font color='orange'>   Warn: Fetched max {max_p*50}.</font>")
-        logging.info(f"Fetched {len(items)} total items for playlist {playlist_id}.")
-        self.excel_log_window.append(f"   Fetched {len(items)} items.")
-        # 4. Sort items
-        try:
-            items_to_sort = [i for i in items if i.get("snippet", {}).get("title")]
-            sorted_items = sorted(items_to_sort, key=lambda i: self.video_sort_key(i["snippet"]["title"]))
-            logging.info("Excel items sorted.")
-            self.excel_log_window.append("   Items sorted.")
-        except Exception as e:
-            logging.exception("Error sorting excel items.")
-            self.excel_log_window.append(f"<font color='orange'>   Warn: Sort failed ({e}). Using API order.</font>")
-            sorted_items = items
-        # 5. Process sorted items
-        excel_data = []
-        chapter_name = ""
-        order_in_chapter = 0
-        seen_ids = set()
-        for item in sorted_items:
-            snip = item.get("snippet", {})
-            cd = item.get("contentDetails", {})
-            vid = cd.get("videoId")
-            title = snip.get("title", "!!! MISSING !!!")
-            desc = snip.get("description", "")
-            pos = snip.get("position", -1)
-            if not vid:
-                logging.warning(f"Excel: Skip pos {pos} ('{title[:50]}...') - no ID.")
-                continue
-            if vid in seen_ids:
-                logging.warning(f"Excel: Skip dup ID {vid} ('{title[:50]}...')")
-                continue
-            seen_ids.add(vid)
-            url = f"https://www.youtube.com/watch?v={vid}"
-            chapter_excel = ""
-            order_excel = 0
-            sort_key = self.video_sort_key(title)
-            # *** CORRECTED LOGIC FOR COURSE INTRODUCTION ***
-            if sort_key[0] == -1:
-                chapter_excel = ""
-                order_excel = 0
-                chapter_name = "Introduction"
-                order_in_chapter = 0
-            elif sort_key[0] == 999:
-                logging.warning(f"Excel: Title '{title}' uses fallback sort.")
-                self.excel_log_window.append(f"<font color='orange'>   Warn: Title '{title[:50]}...' not standard format.</font>")
-                chapter_excel = chapter_name if chapter_name and chapter_name != "Introduction" else "Unknown Chapter Content"
-                order_in_chapter += 1
-                order_excel = order_in_chapter
-            else:
-                is_header = sort_key[1] == 0
-                if is_header:
-                    chapter_name = title
-                    chapter_excel = chapter_name
-                    order_excel = 0
-                    order_in_chapter = 0
-                else:
-                    if not chapter_name or chapter_name == "Introduction":
-                        logging.warning(f"Excel: Part '{title}' found before header.")
-                        self.excel_log_window.append(f"<font color='orange'>   Warn: Part '{title[:30]}...' before header.</font>")
-                        chapter_excel = "Unknown Chapter"
-                        if chapter_name == "Introduction":
-                            order_in_chapter = 0
-                    else:
-                        chapter_excel = chapter_name
-                    order_in_chapter += 1
-                    order_excel = order_in_chapter
-            excel_data.append({
-                'CourseCode': course_code,
-                'Chapter Name': chapter_excel,
-                'Youtubeurl': url,
-                'Video Title': title,
-                'Video Description': desc,
-                'OrderNo in Chapter': order_excel,
-                'Language code': lang_code
-            })
-        # 6. Create DataFrame and save
-        if not excel_data:
-            logging.warning(f"No valid data for playlist {playlist_id}. Skipping '{fname}'.")
-            self.excel_log_window.append("<font color='orange'>   Warn: No valid video data found.</font>")
-            raise ValueError("No valid video data found to create Excel file.")
-        df = pd.DataFrame(excel_data)
-        df = df[['CourseCode', 'Chapter Name', 'Youtubeurl', 'Video Title', 'Video Description', 'OrderNo in Chapter', 'Language code']]
-        logging.info(f"Saving {len(df)} rows to {fpath}")
-        self.excel_log_window.append(f"   Proc {len(df)} items. Saving: {fname}")
-        QApplication.processEvents()
-        try:
-            df.to_excel(fpath, index=False, engine='openpyxl')
-            logging.info(f"Saved: {fpath}")
-        except Exception as e:
-            logging.exception(f"Error saving to Excel: {fpath}")
-            raise IOError(f"Failed to save Excel file {fname}: {e}") from e
-
 # --- Main Execution ---
 if __name__ == '__main__':
     if hasattr(Qt, 'AA_EnableHighDpiScaling'):
@@ -1650,6 +2558,7 @@ if __name__ == '__main__':
         print(f"Warning: Could not set Fusion style: {e}")
     try:
         os.makedirs(MainWindow.get_tokens_dir_abs(), exist_ok=True)
+        MainWindow._dirs_ready = True
     except Exception as dir_e:
         print(f"FATAL ERROR: Cannot create dir {MainWindow.get_tokens_dir_abs()}. Error: {dir_e}", file=sys.stderr)
         QMessageBox.critical(None, "Fatal Error", f"Cannot create dir:\n{MainWindow.get_tokens_dir_abs()}")